@@ -0,0 +1,288 @@
+import argparse
+import atexit
+import contextlib
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from types import ModuleType
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+from utils.metrics import Metrics, collecting
+from utils.tracing import Trace, recording, span
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def days() -> List[int]:
+    """
+    Days with a solver package, found without importing any of them.
+    """
+
+    return sorted(
+        int(entry[len("day") :])
+        for entry in os.listdir(ROOT)
+        if entry.startswith("day")
+        and entry[len("day") :].isdigit()
+        and os.path.isfile(os.path.join(ROOT, entry, "__init__.py"))
+    )
+
+
+@dataclass
+class Shared:
+    """
+    The parsed inputs of a day, and the answers of its fused pass, by input.
+    """
+
+    day: int
+    parsed: Dict[str, Any] = field(default_factory=dict)
+    answers: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+
+sharing = False
+shared: Optional[Shared] = None
+
+
+@contextlib.contextmanager
+def sharing_parsed_inputs(memo: Optional[Shared] = None) -> Generator[None, None, None]:
+    """
+    Within the block the parts of a day parse each input once, starting from
+    what `memo` holds. Only the current day's inputs are kept.
+    """
+
+    global sharing, shared
+    previous = (sharing, shared)
+    (sharing, shared) = (True, memo)
+    try:
+        yield
+    finally:
+        (sharing, shared) = previous
+
+
+def shared_by(day: int) -> Optional[Shared]:
+    global shared
+    if not sharing:
+        return None
+    if shared is None or shared.day != day:
+        shared = Shared(day)
+    return shared
+
+
+@dataclass(frozen=True)
+class Solver:
+    """
+    A day solves its parts with `part1(fn)` and `part2(fn)`. It may also split
+    parsing from solving, declaring
+
+        parse(fn) -> Parsed
+        solve1(parsed: Parsed) -> Answer1
+        solve2(parsed: Parsed) -> Answer2
+
+    and optionally a fused pass computing both answers at once,
+
+        solve_both(parsed: Parsed) -> Tuple[Answer1, Answer2]
+
+    so that a run of both parts parses the input once. The solvers must not
+    modify what they are given, as the other part gets the same object.
+    """
+
+    day: int
+
+    @property
+    def module(self) -> ModuleType:
+        return importlib.import_module(f"day{self.day}")
+
+    @property
+    def fused(self) -> bool:
+        """
+        Whether a run of both parts is a single pass over the parsed input.
+        """
+
+        return hasattr(self.module, "solve_both")
+
+    def part(self, part: int) -> Callable[[str], Any]:
+        solve: Callable[[str], Any] = getattr(self.module, f"part{part}")
+        return solve
+
+    def parsed(self, memo: Shared, fn: str) -> Any:
+        try:
+            return memo.parsed[fn]
+        except KeyError:
+            with span("parse"):
+                memo.parsed[fn] = self.module.parse(fn)
+            return memo.parsed[fn]
+
+    def answer(self, part: int, fn: str) -> Any:
+        module = self.module
+        solve = getattr(module, f"solve{part}", None)
+        if solve is None:
+            return self.part(part)(fn)
+
+        memo = shared_by(self.day)
+        if memo is None:
+            with span("parse"):
+                parsed = module.parse(fn)
+            with span(f"solve{part}"):
+                return solve(parsed)
+        elif hasattr(module, "solve_both"):
+            if fn not in memo.answers:
+                parsed = self.parsed(memo, fn)
+                with span("solve_both"):
+                    memo.answers[fn] = module.solve_both(parsed)
+            return memo.answers[fn][part - 1]
+        else:
+            parsed = self.parsed(memo, fn)
+            with span(f"solve{part}"):
+                return solve(parsed)
+
+
+def default_inputs(day: int) -> List[str]:
+    """
+    The day's samples followed by the puzzle input, as `python -m dayN` runs them.
+    """
+
+    names = os.listdir(os.path.join(ROOT, f"day{day}"))
+    return sorted(n for n in names if n.startswith("sample")) + ["input"]
+
+
+stdin_fn: Optional[str] = None
+
+
+def stdin_path() -> str:
+    """
+    Stdin can only be read once, so it is copied to a file on first use for
+    every part to read, and removed at exit.
+    """
+
+    global stdin_fn
+    if stdin_fn is None:
+        directory = tempfile.mkdtemp(prefix="aoc-")
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        stdin_fn = os.path.join(directory, "stdin")
+        with open(stdin_fn, "wb") as f:
+            shutil.copyfileobj(sys.stdin.buffer, f)
+    return stdin_fn
+
+
+def input_path(day: int, input: str) -> str:
+    """
+    `input` is either the name of a file in the day's directory (`sample`,
+    `input`, ...), a path to an arbitrary input file, or `-` for stdin.
+    """
+
+    if input == "-":
+        return stdin_path()
+    if os.sep in input or os.path.exists(input):
+        return input
+    return f"day{day}/{input}"
+
+
+@dataclass(frozen=True)
+class Job:
+    day: int
+    part: int
+    input_fn: str
+
+    def label(self) -> str:
+        name = os.path.basename(self.input_fn)
+        return f"Day{self.day} Part{self.part} {name.capitalize()}"
+
+    def key(self) -> str:
+        name = os.path.basename(self.input_fn)
+        return f"day{self.day}/part{self.part}/{name}"
+
+    def run(self) -> Any:
+        return Solver(self.day).answer(self.part, self.input_fn)
+
+
+@contextlib.contextmanager
+def quiet() -> Generator[None, None, None]:
+    """
+    Some parts draw their results; silences them when only the answer matters.
+    """
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@dataclass(frozen=True)
+class Result:
+    job: Job
+    answer: Any
+    seconds: float
+    ok: bool = True
+    cached: bool = False
+    metrics: Optional[Metrics] = None
+    trace: Optional[Trace] = None
+
+
+def solve(job: Job) -> Result:
+    """
+    Runs the job, reporting failures in the answer instead of raising, so that
+    one broken part does not stop a run of the whole calendar.
+    """
+
+    start = time.perf_counter()
+    try:
+        return Result(job, job.run(), time.perf_counter() - start)
+    except NotImplementedError:
+        answer = "not implemented"
+    except Exception as e:
+        answer = f"failed: {e!r}"
+    return Result(job, answer, time.perf_counter() - start, ok=False)
+
+
+def metered_solve(job: Job, solve: Callable[[Job], Result] = solve) -> Result:
+    """
+    Solves the job collecting the metrics of its hot paths.
+    """
+
+    with collecting() as collected:
+        result = solve(job)
+    return replace(result, metrics=collected)
+
+
+def traced_solve(job: Job, solve: Callable[[Job], Result] = solve) -> Result:
+    """
+    Solves the job recording the spans of its phases, within one of the whole
+    part.
+    """
+
+    with recording() as trace:
+        with span(job.label(), day=job.day, part=job.part, input=job.input_fn):
+            result = solve(job)
+    return replace(result, trace=trace)
+
+
+def jobs(
+    days: List[int], parts: List[int], inputs: Optional[List[str]] = None
+) -> Generator[Job, None, None]:
+    for day in days:
+        for part in parts:
+            for input in inputs or default_inputs(day):
+                input_fn = input_path(day, input)
+                if os.path.exists(input_fn):
+                    yield Job(day, part, input_fn)
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "days", metavar="DAY", type=int, nargs="*", help="days to run (default: all)"
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=[1, 2], default=[1, 2]
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        nargs="+",
+        help="input names in the day's directory, or paths to input files "
+        "(default: the day's samples and input)",
+    )
+
+
+def selected_jobs(args: argparse.Namespace) -> List[Job]:
+    return list(jobs(args.days or days(), args.part, args.input))
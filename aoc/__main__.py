@@ -0,0 +1,247 @@
+import argparse
+import functools
+import time
+from typing import Callable, List
+
+from aoc import (
+    Job,
+    Result,
+    add_selection_arguments,
+    metered_solve,
+    selected_jobs,
+    sharing_parsed_inputs,
+    solve,
+    traced_solve,
+)
+from utils.tracing import Trace
+
+
+def arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run the selected days and parts."
+    )
+    add_selection_arguments(parser)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        help="run the parts concurrently in this many processes "
+        "(default: one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse the answers of earlier runs while neither the input nor the "
+        "source of the day changed",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        help="size of each of the caches in MiB (default: 64)",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="load the parsed inputs of earlier runs instead of parsing again",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=float,
+        nargs="?",
+        const=60.0,
+        metavar="SECONDS",
+        help="save the state of the long simulations this often (default: 60) "
+        "and resume from it after an interruption",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        metavar="SECONDS",
+        help="stop each part after this long, reporting how far it got",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        metavar="MiB",
+        help="stop each part when its process needs more memory than this",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="how often parts under a limit report their progress (default: 1)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="report the counters and histograms of the solvers' hot paths",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="write the timing spans of the parts' phases (utils.tracing) as "
+        "Chrome trace events, to open in Perfetto or chrome://tracing",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report the time spent per function and the memory allocated",
+    )
+    parser.add_argument(
+        "--sample",
+        action="store_true",
+        help="report where the time goes by sampling the stack, with less "
+        "overhead than --profile, and keep the stacks for flame graphs",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=1,
+        metavar="MS",
+        help="CPU time between the samples of --sample (default: 1)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help="where the .pstats files of --profile and the .collapsed files "
+        "of --sample go (default: profiles)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="number of functions and allocation sites --profile and --sample list",
+    )
+    return parser.parse_args()
+
+
+def write_trace(fn: str, results: List[Result]) -> None:
+    trace = Trace()
+    for result in results:
+        if result.trace is not None:
+            trace.events += result.trace.events
+    with open(fn, "wt") as f:
+        trace.dump(f)
+    print(f"Trace: {fn}")
+
+
+def print_result(result: Result) -> None:
+    print(f"{result.job.label()}: {result.answer}")
+    if result.metrics is not None:
+        print(result.metrics.report())
+
+
+def main() -> None:
+    args = arguments()
+    jobs = selected_jobs(args)
+
+    if args.profile:
+        from aoc.profiling import profile
+
+        for job in jobs:
+            try:
+                answer = profile(job, directory=args.profile_dir, top=args.top)
+            except NotImplementedError:
+                answer = "not implemented"
+            except Exception as e:
+                # As solve() does, so that one broken part does not stop the rest
+                answer = f"failed: {e!r}"
+            print(f"{job.label()}: {answer}")
+        return
+
+    if args.sample:
+        from aoc.sampling import sample
+
+        for job in jobs:
+            try:
+                answer = sample(
+                    job,
+                    directory=args.profile_dir,
+                    top=args.top,
+                    interval=args.sample_interval / 1000,
+                )
+            except NotImplementedError:
+                answer = "not implemented"
+            except Exception as e:
+                answer = f"failed: {e!r}"
+            print(f"{job.label()}: {answer}")
+        return
+
+    solver: Callable[[Job], Result] = solve
+    if args.parse_cache:
+        from aoc.cache import PARSED_DIR, parse_cached_solve
+        from utils.cache import DiskCache
+
+        parsed = DiskCache(PARSED_DIR, max_size=args.cache_size << 20)
+        solver = functools.partial(parse_cached_solve, cache=parsed, solve=solver)
+
+    if args.checkpoint is not None:
+        from aoc.cache import CHECKPOINT_DIR, checkpointed_solve
+        from utils.cache import DiskCache
+
+        checkpoints = DiskCache(CHECKPOINT_DIR, max_size=args.cache_size << 20)
+        solver = functools.partial(
+            checkpointed_solve, cache=checkpoints, every=args.checkpoint, solve=solver
+        )
+
+    if args.metrics:
+        solver = functools.partial(metered_solve, solve=solver)
+
+    if args.trace is not None:
+        solver = functools.partial(traced_solve, solve=solver)
+
+    if args.time_limit is not None or args.memory_limit is not None:
+        from aoc.budget import budgeted_solve
+
+        solver = functools.partial(
+            budgeted_solve,
+            seconds=args.time_limit,
+            memory=None if args.memory_limit is None else args.memory_limit << 20,
+            interval=args.progress_interval,
+            solve=solver,
+        )
+
+    if args.cache:
+        from aoc.cache import CACHE_DIR, cached_solve
+        from utils.cache import DiskCache
+
+        cache = DiskCache(CACHE_DIR, max_size=args.cache_size << 20)
+        solver = functools.partial(cached_solve, cache=cache, solve=solver)
+
+    if args.jobs is None:
+        results = []
+        with sharing_parsed_inputs():
+            for job in jobs:
+                result = solver(job)
+                print_result(result)
+                results.append(result)
+        if args.trace is not None:
+            write_trace(args.trace, results)
+        return
+
+    from aoc.pool import results_table, solve_all
+
+    start = time.perf_counter()
+    results = []
+    for result in solve_all(jobs, workers=args.jobs or None, solve=solver):
+        print_result(result)
+        results.append(result)
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(results_table(sorted(results, key=lambda r: jobs.index(r.job))), end="")
+    print(
+        f"{len(results)} jobs in {elapsed:.3f}s "
+        f"({sum(r.seconds for r in results):.3f}s of solving, "
+        f"{sum(r.cached for r in results)} cached)"
+    )
+    if args.trace is not None:
+        write_trace(args.trace, results)
+
+
+if __name__ == "__main__":
+    main()
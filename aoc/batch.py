@@ -0,0 +1,137 @@
+"""
+Solves a day for many input files in one process (or one pool of processes),
+writing a row per file.
+
+python -m aoc.batch DAY INPUT ... [-p PART ...] [-j [N]] [-f {csv,jsonl}] [-o FILE]
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import json
+import os
+import sys
+from typing import IO, Any, Dict, Generator, Iterable, List, Optional
+
+from aoc import Job, Result, Solver, solve
+from aoc.pool import quiet_solve_all, solve_all
+
+
+def input_files(patterns: List[str]) -> List[str]:
+    """
+    Every file in the given directories, files and glob patterns.
+    """
+
+    files: List[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files += sorted(
+                os.path.join(pattern, fn)
+                for fn in os.listdir(pattern)
+                if os.path.isfile(os.path.join(pattern, fn))
+            )
+        elif os.path.exists(pattern):
+            files.append(pattern)
+        else:
+            files += sorted(fn for fn in glob.glob(pattern) if os.path.isfile(fn))
+    return files
+
+
+def columns(day: int, parts: List[int]) -> List[str]:
+    """
+    A day with a fused pass solves both parts at once, so their time is one
+    `seconds` column instead of one per part.
+    """
+
+    if Solver(day).fused and len(set(parts)) > 1:
+        return ["file"] + [f"part{p}" for p in parts] + ["seconds"]
+    return ["file"] + [c for p in parts for c in [f"part{p}", f"part{p}_seconds"]]
+
+
+def rows(
+    day: int, files: List[str], parts: List[int], workers: Optional[int] = None
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    A row for each file as soon as all of its parts are solved, in the order
+    they finish.
+    """
+
+    jobs = [Job(day, part, fn) for fn in files for part in parts]
+    results: Iterable[Result] = (
+        (
+            result
+            for fn in files
+            for result in quiet_solve_all([Job(day, part, fn) for part in parts], solve)
+        )
+        if workers is None
+        else solve_all(jobs, workers=workers or None)
+    )
+
+    names = columns(day, parts)
+    pending: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        row = pending.setdefault(result.job.input_fn, {"file": result.job.input_fn})
+        row[f"part{result.job.part}"] = result.answer
+        if "seconds" in names:
+            row["seconds"] = round(row.get("seconds", 0) + result.seconds, 6)
+        else:
+            row[f"part{result.job.part}_seconds"] = round(result.seconds, 6)
+        if len(row) == len(names):
+            del pending[result.job.input_fn]
+            yield {column: row[column] for column in names}
+
+
+def write_csv(out: IO[str], names: List[str], rows: Iterable[Dict[str, Any]]) -> None:
+    writer = csv.DictWriter(out, fieldnames=names)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        out.flush()
+
+
+def write_jsonl(out: IO[str], rows: Iterable[Dict[str, Any]]) -> None:
+    for row in rows:
+        out.write(json.dumps(row, default=str))
+        out.write("\n")
+        out.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.batch",
+        description="Solve a day for many input files.",
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", metavar="INPUT", nargs="+", help="files, directories or globs"
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=[1, 2], default=[1, 2]
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        help="solve the files in this many processes (default: one per CPU)",
+    )
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args()
+
+    results = rows(args.day, input_files(args.inputs), args.part, workers=args.jobs)
+    with (
+        open(args.output, "wt", newline="")
+        if args.output is not None
+        else contextlib.nullcontext(sys.stdout)
+    ) as out:
+        if args.format == "csv":
+            write_csv(out, columns(args.day, args.part), results)
+        else:
+            write_jsonl(out, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Times the selected days and parts, and compares them against stored baselines.
+
+python -m aoc.benchmark [DAY ...] [--save] [--threshold 0.1]
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+from aoc import Job, add_selection_arguments, quiet, selected_jobs
+
+DEFAULT_BASELINE = "benchmark.json"
+
+
+@dataclass(frozen=True)
+class Measurement:
+    runs: int
+    median: float
+    p95: float
+    peak_memory: int
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile, so that it is an actually measured value.
+    """
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def measure(job: Job, repeat: int = 5, warmup: int = 1) -> Measurement:
+    with quiet():
+        for _ in range(warmup):
+            job.run()
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            job.run()
+            timings.append(time.perf_counter() - start)
+
+        # Tracing allocations slows the run down, so it gets a run of its own.
+        tracemalloc.start()
+        try:
+            job.run()
+            (_, peak_memory) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Measurement(
+        runs=repeat,
+        median=percentile(timings, 50),
+        p95=percentile(timings, 95),
+        peak_memory=peak_memory,
+    )
+
+
+def load_baseline(fn: str) -> Dict[str, Measurement]:
+    try:
+        with open(fn, "rt") as f:
+            return {key: Measurement(**m) for key, m in json.load(f).items()}
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(fn: str, measurements: Dict[str, Measurement]) -> None:
+    with open(fn, "wt") as f:
+        json.dump(
+            {key: asdict(m) for key, m in sorted(measurements.items())}, f, indent=2
+        )
+        f.write("\n")
+
+
+def regressions(
+    baseline: Measurement, current: Measurement, threshold: float
+) -> List[str]:
+    found = []
+    if current.median > baseline.median * (1 + threshold):
+        found.append(
+            f"median {baseline.median * 1000:.2f}ms -> {current.median * 1000:.2f}ms"
+        )
+    if current.peak_memory > baseline.peak_memory * (1 + threshold):
+        found.append(
+            f"peak memory {baseline.peak_memory / 1024:.0f}KiB -> {current.peak_memory / 1024:.0f}KiB"
+        )
+    return found
+
+
+def arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.benchmark",
+        description="Benchmark the selected days and parts.",
+    )
+    add_selection_arguments(parser)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument("-b", "--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown (or memory growth) reported as regression",
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store the measurements as the new baseline",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = arguments()
+    baseline = load_baseline(args.baseline)
+    measurements: Dict[str, Measurement] = {}
+    regressed = False
+
+    print(f"{'job':<24} {'median':>10} {'p95':>10} {'peak mem':>10}")
+    for job in selected_jobs(args):
+        try:
+            m = measure(job, repeat=args.repeat, warmup=args.warmup)
+        except NotImplementedError:
+            print(f"{job.key():<24} not implemented")
+            continue
+        except Exception as e:
+            print(f"{job.key():<24} failed: {e!r}")
+            continue
+        measurements[job.key()] = m
+        print(
+            f"{job.key():<24} {m.median * 1000:>8.2f}ms {m.p95 * 1000:>8.2f}ms {m.peak_memory / 1024:>7.0f}KiB"
+        )
+        if job.key() in baseline:
+            for regression in regressions(baseline[job.key()], m, args.threshold):
+                regressed = True
+                print(f"  REGRESSION: {regression}")
+
+    if args.save:
+        save_baseline(args.baseline, {**baseline, **measurements})
+
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Runs a job in a child process under a wall-clock and memory budget, so that a
+search that does not finish stops with the progress it made instead of
+hanging the whole run.
+"""
+
+import math
+import resource
+import sys
+import time
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Callable, Optional
+
+from aoc import Job, Result, solve
+from utils import progress
+from utils.progress import Progress
+
+
+def print_progress(job: Job, progress: Progress) -> None:
+    print(f"{job.label()}: {progress}", file=sys.stderr, flush=True)
+
+
+def run_child(
+    job: Job,
+    memory: Optional[int],
+    interval: float,
+    solve: Callable[[Job], Result],
+    connection: Connection,
+) -> None:
+    if memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+
+    with progress.reporting(connection.send, every=interval) as made:
+        result = solve(job)
+    if not result.ok and made.nodes > 0:
+        result = Result(job, f"{result.answer} ({made})", result.seconds, ok=False)
+    connection.send(result)
+
+
+def budgeted_solve(
+    job: Job,
+    seconds: Optional[float] = None,
+    memory: Optional[int] = None,
+    interval: float = 1.0,
+    on_progress: Callable[[Job, Progress], None] = print_progress,
+    solve: Callable[[Job], Result] = solve,
+) -> Result:
+    """
+    Solves the job in a child process limited to `memory` bytes of address
+    space, killing it after `seconds`. The progress reported by the searches
+    of the solver (`utils.progress`) is passed to `on_progress` as it comes,
+    and the last of it ends up in the answer of a job that ran out of budget.
+    """
+
+    (receiver, sender) = Pipe(duplex=False)
+    child = Process(
+        target=run_child, args=(job, memory, interval, solve, sender), daemon=True
+    )
+    start = time.perf_counter()
+    deadline = math.inf if seconds is None else start + seconds
+    child.start()
+    sender.close()
+
+    latest: Optional[Progress] = None
+
+    def stopped(reason: str) -> Result:
+        child.kill()
+        child.join()
+        answer = reason if latest is None else f"{reason} ({latest})"
+        return Result(job, answer, time.perf_counter() - start, ok=False)
+
+    with receiver:
+        while True:
+            left = deadline - time.perf_counter()
+            if left <= 0 or not receiver.poll(None if left == math.inf else left):
+                return stopped(f"out of time after {seconds:g}s")
+            try:
+                message = receiver.recv()
+            except EOFError:
+                # Killed without a chance to report, e.g. by the OOM killer
+                child.join()
+                return stopped(f"died with exit code {child.exitcode}")
+            if isinstance(message, Progress):
+                latest = message
+                on_progress(job, message)
+            else:
+                child.join()
+                assert isinstance(message, Result)
+                return message
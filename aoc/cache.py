@@ -0,0 +1,79 @@
+import os
+import time
+from typing import Callable
+
+from aoc import ROOT, Job, Result, solve
+from utils.cache import (
+    DiskCache,
+    caching_parsed_inputs,
+    digest,
+    file_digest,
+    source_digest,
+)
+from utils.checkpoint import checkpointing
+
+CACHE_DIR = os.path.join(ROOT, ".cache", "results")
+PARSED_DIR = os.path.join(ROOT, ".cache", "parsed")
+CHECKPOINT_DIR = os.path.join(ROOT, ".cache", "checkpoints")
+
+
+def result_key(job: Job) -> str:
+    """
+    Any change to the input, or to the source of the day or of the modules it
+    imports, gives a new key.
+    """
+
+    return digest(
+        f"day{job.day}",
+        f"part{job.part}",
+        file_digest(job.input_fn),
+        source_digest(f"day{job.day}"),
+    )
+
+
+def cached_solve(
+    job: Job, cache: DiskCache, solve: Callable[[Job], Result] = solve
+) -> Result:
+    if job.input_fn == "-":
+        # Can not be read twice, to hash and to solve
+        return solve(job)
+
+    start = time.perf_counter()
+    key = result_key(job)
+    try:
+        return Result(job, cache.get(key), time.perf_counter() - start, cached=True)
+    except KeyError:
+        pass
+
+    result = solve(job)
+    if result.ok:
+        cache.put(key, result.answer)
+    return result
+
+
+def parse_cached_solve(
+    job: Job, cache: DiskCache, solve: Callable[[Job], Result] = solve
+) -> Result:
+    """
+    Solves the job loading what its parser produced in an earlier run, for the
+    days whose parsers are decorated with `utils.cache.cached_parse`.
+    """
+
+    with caching_parsed_inputs(cache):
+        return solve(job)
+
+
+def checkpointed_solve(
+    job: Job,
+    cache: DiskCache,
+    every: float = 60.0,
+    solve: Callable[[Job], Result] = solve,
+) -> Result:
+    """
+    Solves the job resuming its simulations (`utils.checkpoint`) from where an
+    earlier, interrupted run left them, and checkpointing them every `every`
+    seconds.
+    """
+
+    with checkpointing(cache, every):
+        return solve(job)
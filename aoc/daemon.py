@@ -0,0 +1,217 @@
+"""
+A long-lived solver process, so that repeated runs do not pay for starting
+Python, importing the days and parsing their inputs every time.
+
+python -m aoc.daemon [--socket PATH] serve
+python -m aoc.daemon [--socket PATH] run [DAY ...] [-p PART ...] [-i INPUT ...]
+python -m aoc.daemon [--socket PATH] stop
+
+Requests and responses are JSON lines over a Unix domain socket. A day is
+imported again when the files in its directory change, and an input is
+parsed again when its mtime changes and its contents hash differently. Changes
+to `utils` need a restart.
+
+Only the days split into `parse` and `solve1`/`solve2` keep what they parsed
+between runs. The ones with just `part1`/`part2` read and parse their input
+on every run, and only save the start and the import.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from typing import Any, Dict, Generator, List, Tuple
+
+from aoc import (
+    ROOT,
+    Job,
+    Shared,
+    add_selection_arguments,
+    selected_jobs,
+    sharing_parsed_inputs,
+    solve,
+)
+from utils.cache import file_digest
+
+SOCKET = os.path.join(ROOT, ".cache", "daemon.sock")
+
+
+def source_stamps(day: int) -> Dict[str, int]:
+    directory = os.path.join(ROOT, f"day{day}")
+    return {
+        entry.path: entry.stat().st_mtime_ns
+        for entry in os.scandir(directory)
+        if entry.name.endswith(".py")
+    }
+
+
+class Solvers:
+    """
+    The days imported so far, and their parsed inputs.
+    """
+
+    memos: Dict[int, Shared]
+    sources: Dict[int, Dict[str, int]]
+    # mtime and digest of each input, by day and input
+    inputs: Dict[Tuple[int, str], Tuple[int, str]]
+
+    def __init__(self) -> None:
+        self.memos = {}
+        self.sources = {}
+        self.inputs = {}
+
+    def forget(self, day: int) -> None:
+        self.memos.pop(day, None)
+        for (input_day, fn) in list(self.inputs):
+            if input_day == day:
+                del self.inputs[(input_day, fn)]
+
+    def check_source(self, day: int) -> None:
+        stamps = source_stamps(day)
+        if self.sources.get(day, stamps) != stamps:
+            for name in list(sys.modules):
+                if name == f"day{day}" or name.startswith(f"day{day}."):
+                    del sys.modules[name]
+            # What was parsed holds instances of the old classes
+            self.forget(day)
+        self.sources[day] = stamps
+
+    def check_input(self, day: int, fn: str) -> None:
+        try:
+            mtime = os.stat(fn).st_mtime_ns
+        except OSError:
+            # Left for the solver to report
+            return
+        known = self.inputs.get((day, fn))
+        if known is not None and known[0] == mtime:
+            return
+
+        digest = file_digest(fn)
+        if known is not None and known[1] != digest:
+            memo = self.memos.get(day)
+            if memo is not None:
+                memo.parsed.pop(fn, None)
+                memo.answers.pop(fn, None)
+        self.inputs[(day, fn)] = (mtime, digest)
+
+    def run(self, job: Job) -> Dict[str, Any]:
+        self.check_source(job.day)
+        self.check_input(job.day, job.input_fn)
+        memo = self.memos.setdefault(job.day, Shared(job.day))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), sharing_parsed_inputs(memo):
+            result = solve(job)
+        return {
+            "label": job.label(),
+            "answer": result.answer,
+            "seconds": result.seconds,
+            "ok": result.ok,
+            "output": output.getvalue(),
+        }
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get("command") == "stop":
+                response: Dict[str, Any] = {"stopping": True}
+                # shutdown() waits for serve_forever(), which runs this handler
+                threading.Thread(target=self.server.shutdown).start()
+            else:
+                job = Job(request["day"], request["part"], request["input"])
+                response = self.server.solvers.run(job)
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.UnixStreamServer):
+    """
+    Handles one connection at a time, as the solvers keep global state.
+    """
+
+    solvers: Solvers
+
+    def __init__(self, path: str) -> None:
+        self.solvers = Solvers()
+        super().__init__(path, Handler)
+
+
+def serve(path: str = SOCKET) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+    with Server(path) as server:
+        print(f"Serving on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+@contextlib.contextmanager
+def connection(path: str = SOCKET) -> Generator[socket.socket, None, None]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        yield client
+
+
+def requests(
+    messages: List[Dict[str, Any]], path: str = SOCKET
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Sends the messages over one connection, yielding a response to each.
+    """
+
+    with connection(path) as client, client.makefile("rwb") as stream:
+        for message in messages:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            response: Dict[str, Any] = json.loads(stream.readline())
+            yield response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.daemon",
+        description="Keep the solvers warm in a server process.",
+    )
+    parser.add_argument("--socket", default=SOCKET, help=f"(default: {SOCKET})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the server in the foreground")
+    commands.add_parser("stop", help="stop the server")
+    run = commands.add_parser(
+        "run",
+        help="solve the selected parts in the server",
+        description="Solve the selected parts in the server. Only the days "
+        "with parse and solve1/solve2 keep their parsed inputs between runs.",
+    )
+    add_selection_arguments(run)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket)
+    elif args.command == "stop":
+        for _ in requests([{"command": "stop"}], args.socket):
+            pass
+    else:
+        jobs = selected_jobs(args)
+        messages = [
+            {"day": job.day, "part": job.part, "input": os.path.abspath(job.input_fn)}
+            for job in jobs
+        ]
+        for response in requests(messages, args.socket):
+            print(response["output"], end="")
+            print(f"{response['label']}: {response['answer']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,542 @@
+"""
+Random, but valid, puzzle inputs of any size, for benchmarks and scaling tests.
+
+python -m aoc.generate DAY SIZE [--seed SEED] [-o FILE]
+
+`SIZE` is the natural measure of each day's input: the number of lines,
+elves, instructions, sensors, ... as documented on the generator.
+"""
+
+import argparse
+import json
+import math
+import random
+import string
+import sys
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
+
+Lines = Generator[str, None, None]
+
+
+def day1(size: int, rng: random.Random) -> Lines:
+    """
+    `size` elves, carrying 1-10 items each
+    """
+
+    for elf in range(size):
+        if elf > 0:
+            yield ""
+        for _ in range(rng.randint(1, 10)):
+            yield str(rng.randint(1000, 60000))
+
+
+def day2(size: int, rng: random.Random) -> Lines:
+    """
+    `size` rounds
+    """
+
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def day3(size: int, rng: random.Random) -> Lines:
+    """
+    `size` rucksacks, rounded up to complete groups of three
+    """
+
+    items = string.ascii_letters
+    for _ in range(math.ceil(size / 3)):
+        badge = rng.choice(items)
+        others = [i for i in items if i != badge]
+        rng.shuffle(others)
+        # Each rucksack of the group gets its own items, so that only the
+        # badge is common to all three.
+        for pool in [others[0:17], others[17:34], others[34:51]]:
+            common = pool[0]
+            left_pool, right_pool = pool[1:9], pool[9:]
+            half = rng.randint(2, 16)
+            left = [common] + rng.choices(left_pool, k=half - 1)
+            right = [common] + rng.choices(right_pool, k=half - 1)
+            rng.choice([left, right])[rng.randint(1, half - 1)] = badge
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield "".join(left + right)
+
+
+def day4(size: int, rng: random.Random) -> Lines:
+    """
+    `size` pairs of section assignments
+    """
+
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    for _ in range(size):
+        yield f"{assignment()},{assignment()}"
+
+
+def day5(size: int, rng: random.Random) -> Lines:
+    """
+    9 stacks of crates, and `size` rearrangement instructions
+    """
+
+    stacks = 9
+    heights = [rng.randint(3, 8) for _ in range(stacks)]
+
+    for level in range(max(heights) - 1, -1, -1):
+        yield "".join(
+            f"[{rng.choice(string.ascii_uppercase)}] " if height > level else "    "
+            for height in heights
+        ).rstrip()
+    yield "".join(f" {i}  " for i in range(1, stacks + 1)).rstrip()
+    yield ""
+
+    for _ in range(size):
+        # No stack is ever emptied, as the answer is made of the top crates
+        from_index = rng.choice([i for i in range(stacks) if heights[i] > 1])
+        to_index = rng.choice([i for i in range(stacks) if i != from_index])
+        count = rng.randint(1, heights[from_index] - 1)
+        heights[from_index] -= count
+        heights[to_index] += count
+        yield f"move {count} from {from_index + 1} to {to_index + 1}"
+
+
+def day6(size: int, rng: random.Random) -> Lines:
+    """
+    A datastream of `size` characters (at least 14): random a, b and c, then
+    d to q. The start-of-packet marker ends on one of d to g, and the
+    start-of-message marker on one of the last four characters.
+    """
+
+    # Three letters can not make a marker, the 14 distinct ones at the end can
+    head = "".join(rng.choice("abc") for _ in range(max(0, size - 14)))
+    yield head + "defghijklmnopq"
+
+
+def day7(size: int, rng: random.Random) -> Lines:
+    """
+    A filesystem of `size` directories
+    """
+
+    children: List[List[int]] = [[] for _ in range(size)]
+    for child in range(1, size):
+        children[rng.randrange(child)].append(child)
+
+    # Walked without recursion, as deep filesystems would exhaust the stack;
+    # None stands for going back up.
+    yield "$ cd /"
+    stack: List[Optional[int]] = [0]
+    while stack:
+        d = stack.pop()
+        if d is None:
+            yield "$ cd .."
+            continue
+        if d != 0:
+            yield f"$ cd d{d}"
+        yield "$ ls"
+        for child in children[d]:
+            yield f"dir d{child}"
+        for f in range(rng.randint(0, 4)):
+            yield f"{rng.randint(1000, 300000)} f{f}.txt"
+        for child in reversed(children[d]):
+            stack += [None, child]
+
+
+def day8(size: int, rng: random.Random) -> Lines:
+    """
+    A `size` x `size` forest
+    """
+
+    for _ in range(size):
+        yield "".join(rng.choice(string.digits) for _ in range(size))
+
+
+def day9(size: int, rng: random.Random) -> Lines:
+    """
+    `size` motions of the head
+    """
+
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
+
+
+def day10(size: int, rng: random.Random) -> Lines:
+    """
+    `size` instructions, at least 240 of them so the screen gets drawn
+    """
+
+    for _ in range(max(size, 240)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            yield f"addx {rng.choice([-1, 1]) * rng.randint(1, 10)}"
+
+
+def day11(size: int, rng: random.Random) -> Lines:
+    """
+    `size` monkeys, at least 2
+    """
+
+    size = max(size, 2)
+    for monkey in range(size):
+        if monkey > 0:
+            yield ""
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 6))]
+        operation = rng.choice(
+            [f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"]
+            + (["old * old"] if monkey % 4 == 0 else [])
+        )
+        others = [m for m in range(size) if m != monkey]
+        yield f"Monkey {monkey}:"
+        yield f"  Starting items: {', '.join(str(i) for i in items)}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {rng.choice([2, 3, 5, 7, 11, 13, 17, 19, 23])}"
+        yield f"    If true: throw to monkey {rng.choice(others)}"
+        yield f"    If false: throw to monkey {rng.choice(others)}"
+
+
+def day12(size: int, rng: random.Random) -> Lines:
+    """
+    A `size` x 4*`size` heightmap. Heights change by at most one between
+    neighbors, so every square can reach every other.
+    """
+
+    rows, cols = max(size, 2), max(4 * size, 2)
+    end = (rng.randrange(rows), rng.randrange(cols))
+
+    def distance(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    # The minimum of functions changing by one per step changes by at most one
+    # per step as well.
+    valleys = []
+    for _ in range(8):
+        valley = (rng.randrange(rows), rng.randrange(cols))
+        valleys.append((valley, max(0, 25 - distance(valley, end)) + rng.randint(0, 3)))
+
+    heights = [
+        [
+            max(
+                0,
+                min(
+                    [25 - distance((x, y), end)]
+                    + [h + distance((x, y), v) for (v, h) in valleys]
+                ),
+            )
+            for y in range(cols)
+        ]
+        for x in range(rows)
+    ]
+    start = min(
+        ((x, y) for x in range(rows) for y in range(cols) if (x, y) != end),
+        key=lambda p: (heights[p[0]][p[1]], rng.random()),
+    )
+
+    for x in range(rows):
+        line = [chr(ord("a") + h) for h in heights[x]]
+        if start[0] == x:
+            line[start[1]] = "S"
+        if end[0] == x:
+            line[end[1]] = "E"
+        yield "".join(line)
+
+
+def day13(size: int, rng: random.Random) -> Lines:
+    """
+    `size` pairs of packets
+    """
+
+    def packet(depth: int = 0) -> List[Any]:
+        return [
+            packet(depth + 1)
+            if depth < 4 and rng.random() < 0.3
+            else rng.randint(0, 10)
+            for _ in range(rng.randint(0, 5))
+        ]
+
+    for pair in range(size):
+        if pair > 0:
+            yield ""
+        for _ in range(2):
+            yield json.dumps(packet(), separators=(",", ":"))
+
+
+def day14(size: int, rng: random.Random) -> Lines:
+    """
+    `size` paths of rock, spread over a cave that grows with their number.
+    The rock starts deeper than it is wide, so the cone of sand below the
+    inlet can not rest on it before spilling past its sides: part 1 always
+    ends with sand falling into the abyss, and part 2 fills a pile that grows
+    with the cave.
+    """
+
+    height = 10 + 5 * math.isqrt(size)
+    # Paths reach at most 2 * 8 to either side of where they start
+    top = height + 2 * 8 + 1
+    for _ in range(size):
+        x = rng.randint(500 - height, 500 + height)
+        y = rng.randint(top, top + height)
+        points = [f"{x},{y}"]
+        for segment in range(rng.randint(1, 4)):
+            length = rng.choice([-1, 1]) * rng.randint(1, 8)
+            if segment % 2 == 0:
+                x += length
+            else:
+                y = y + length if y + length >= top else y - length
+            points.append(f"{x},{y}")
+        yield " -> ".join(points)
+
+
+def day15(size: int, rng: random.Random) -> Lines:
+    """
+    `size` sensors on a jittered lattice over the 4000000 x 4000000 square,
+    plus one just outside each of its corners. As in the puzzle, exactly one
+    spot of the square is out of their reach; it is on one of the first
+    20000 rows, for part 2 to finish in seconds.
+    """
+
+    max_coord = 4000000
+    hidden = (rng.randint(0, max_coord), rng.randint(0, 20000))
+
+    def distance(x: int, y: int) -> int:
+        return abs(x - hidden[0]) + abs(y - hidden[1])
+
+    side = math.isqrt(size - 1) + 1 if size > 0 else 0
+    spacing = max_coord // max(side, 1)
+    jitter = spacing // 8
+    for i in range(size):
+        # Rows are filled from the one centered on y=2000000, which part 1 checks
+        row = (side // 2 + i // side) % side
+        x = (i % side) * spacing + spacing // 2 + rng.randint(-jitter, jitter)
+        y = 2000000 + (row - side // 2) * spacing + rng.randint(-jitter, jitter)
+        if distance(x, y) < 2:
+            x += 3 if x >= hidden[0] else -3
+        # Their coverage is small enough for each beacon to be the one closest
+        # to its sensor, and stops short of the hidden spot
+        radius = rng.randint(spacing // 8, (spacing - 2 * jitter) // 2 - 1)
+        radius = max(1, min(radius, distance(x, y) - 1))
+        dx = rng.randint(-radius, radius)
+        dy = rng.choice([-1, 1]) * (radius - abs(dx))
+        yield (f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y + dy}")
+
+    # Reaching up to the hidden spot, the corners cover the square on either
+    # side of its two diagonals, which only cross at the spot
+    (low, high) = (-1, max_coord + 1)
+    for (x, y) in [(low, low), (low, high), (high, low), (high, high)]:
+        radius = distance(x, y) - 1
+        dx = radius if x < 0 else -radius
+        yield f"Sensor at x={x}, y={y}: closest beacon is at x={x + dx}, y={y}"
+
+
+def day16(size: int, rng: random.Random) -> Lines:
+    """
+    `size` valves (2 to 676), a quarter of them with a working flow rate
+    """
+
+    size = min(max(size, 2), 26 * 26)
+    names = ["AA"] + rng.sample(
+        [
+            a + b
+            for a in string.ascii_uppercase
+            for b in string.ascii_uppercase
+            if a + b != "AA"
+        ],
+        size - 1,
+    )
+    tunnels: Dict[str, Set[str]] = {name: set() for name in names}
+
+    def connect(a: str, b: str) -> None:
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    for i in range(1, size):
+        connect(names[i], names[rng.randrange(i)])
+    for _ in range(size // 2):
+        (a, b) = rng.sample(names, 2)
+        connect(a, b)
+
+    working = set(rng.sample(names[1:], max(1, (size - 1) // 4)))
+    for name in names:
+        flow_rate = rng.randint(1, 25) if name in working else 0
+        others = sorted(tunnels[name])
+        if len(others) == 1:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnel leads to valve {others[0]}"
+        else:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnels lead to valves {', '.join(others)}"
+
+
+def day17(size: int, rng: random.Random) -> Lines:
+    """
+    A jet pattern of `size` pushes
+    """
+
+    yield "".join(rng.choice("<>") for _ in range(max(size, 1)))
+
+
+def day18(size: int, rng: random.Random) -> Lines:
+    """
+    `size` cubes filling about a quarter of a box, as the puzzle input does;
+    the solver's grid grows with the box
+    """
+
+    side = max(1, math.ceil((4 * size) ** (1 / 3)))
+    for cube in rng.sample(range(side**3), min(size, side**3)):
+        yield f"{cube // side // side},{cube // side % side},{cube % side}"
+
+
+def day20(size: int, rng: random.Random) -> Lines:
+    """
+    `size` numbers (at least 2) to mix, exactly one of them 0
+    """
+
+    size = max(size, 2)
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(size - 1)]
+    numbers.insert(rng.randrange(size), 0)
+    for number in numbers:
+        yield str(number)
+
+
+def day21(size: int, rng: random.Random) -> Lines:
+    """
+    `size` monkeys, rounded up to an odd number
+    """
+
+    names: Set[str] = {"root", "humn"}
+    while len(names) < size + 2:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=4)))
+    pool = sorted(names - {"root", "humn"})
+    rng.shuffle(pool)
+
+    # The tree is built from the leaves up, keeping track of the values so no
+    # monkey ever divides by zero, or into a fraction
+    jobs: List[str] = []
+    leaves: List[Tuple[str, int]] = []
+    for name in ["humn"] + pool[: max(size - 1, 2) // 2]:
+        value = rng.randint(1, 20)
+        jobs.append(f"{name}: {value}")
+        leaves.append((name, value))
+    pool = pool[max(size - 1, 2) // 2 :]
+
+    while len(leaves) > 1:
+        (left, left_value) = leaves.pop(rng.randrange(len(leaves)))
+        (right, right_value) = leaves.pop(rng.randrange(len(leaves)))
+        name = pool.pop() if len(leaves) > 0 else "root"
+        ops: List[Tuple[str, Callable[[int, int], int]]] = [
+            ("+", lambda a, b: a + b),
+            ("-", lambda a, b: a - b),
+        ]
+        if abs(left_value * right_value) < 10**6:
+            ops.append(("*", lambda a, b: a * b))
+        if right_value != 0 and left_value % right_value == 0:
+            ops.append(("/", lambda a, b: a // b))
+        (op, apply) = rng.choice(ops)
+        jobs.append(f"{name}: {left} {op} {right}")
+        leaves.append((name, apply(left_value, right_value)))
+
+    rng.shuffle(jobs)
+    yield from jobs
+
+
+def day22(size: int, rng: random.Random) -> Lines:
+    """
+    A flat board (not a cube net) about `size` x `size`, and 4*`size` moves
+    """
+
+    size = max(size, 2)
+    # Rows start further left and end further right going down, so that both
+    # rows and columns of the board are contiguous
+    starts = sorted((rng.randint(0, size // 2) for _ in range(size)), reverse=True)
+    ends = sorted(rng.randint(size // 2 + 1, 2 * size) for _ in range(size))
+    for row, (start, end) in enumerate(zip(starts, ends)):
+        cells = ["#" if rng.random() < 0.1 else "." for _ in range(start, end)]
+        if row == 0:
+            cells[0] = "."
+        yield " " * start + "".join(cells)
+    yield ""
+    path = str(rng.randint(1, size))
+    for _ in range(4 * size):
+        path += rng.choice("LR") + str(rng.randint(1, size))
+    yield path
+
+
+def day23(size: int, rng: random.Random) -> Lines:
+    """
+    `size` elves, on about half of a square field
+    """
+
+    side = math.isqrt(2 * size) + 1
+    elves = set(rng.sample(range(side * side), min(size, side * side)))
+    for x in range(side):
+        yield "".join("#" if x * side + y in elves else "." for y in range(side))
+
+
+def day25(size: int, rng: random.Random) -> Lines:
+    """
+    `size` SNAFU numbers
+    """
+
+    from day25 import to_snafu
+
+    for _ in range(size):
+        yield to_snafu(rng.randint(1, 10**12))
+
+
+GENERATORS: Dict[int, Callable[[int, random.Random], Lines]] = {
+    1: day1,
+    2: day2,
+    3: day3,
+    4: day4,
+    5: day5,
+    6: day6,
+    7: day7,
+    8: day8,
+    9: day9,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+    16: day16,
+    17: day17,
+    18: day18,
+    20: day20,
+    21: day21,
+    22: day22,
+    23: day23,
+    25: day25,
+}
+
+
+def generate(day: int, size: int, seed: Optional[int] = None) -> Lines:
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write(fn: str, day: int, size: int, seed: Optional[int] = None) -> None:
+    with open(fn, "wt") as f:
+        for line in generate(day, size, seed):
+            f.write(line)
+            f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.generate", description="Generate a puzzle input."
+    )
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS.keys()))
+    parser.add_argument("size", type=int)
+    parser.add_argument("-s", "--seed", type=int)
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    args = parser.parse_args()
+
+    if args.output is not None:
+        write(args.output, args.day, args.size, args.seed)
+    else:
+        for line in generate(args.day, args.size, args.seed):
+            sys.stdout.write(line)
+            sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
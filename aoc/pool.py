@@ -0,0 +1,46 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+
+from aoc import Job, Result, Solver, quiet, sharing_parsed_inputs, solve
+
+
+def quiet_solve_all(jobs: List[Job], solve: Callable[[Job], Result]) -> List[Result]:
+    with quiet(), sharing_parsed_inputs():
+        return [solve(job) for job in jobs]
+
+
+def solve_all(
+    jobs: List[Job],
+    workers: Optional[int] = None,
+    solve: Callable[[Job], Result] = solve,
+) -> Generator[Result, None, None]:
+    """
+    Fans the jobs out to a pool of processes, yielding the results in the order
+    they finish. The parts of the days with a fused pass go to the same
+    process, one after the other, as they are solved together anyway; the
+    others run in parallel, each parsing the input.
+    """
+
+    groups: Dict[Tuple[int, int, str], List[Job]] = {}
+    for job in jobs:
+        part = 0 if Solver(job.day).fused else job.part
+        groups.setdefault((job.day, part, job.input_fn), []).append(job)
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(quiet_solve_all, group, solve) for group in groups.values()
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def results_table(results: List[Result]) -> str:
+    table = f"{'job':<24} {'time':>10}  answer\n"
+    for result in results:
+        (first, *rest) = str(result.answer).splitlines() or [""]
+        cached = "*" if result.cached else " "
+        table += f"{result.job.key():<24} {result.seconds:>9.3f}s{cached} {first}\n"
+        for line in rest:
+            table += f"{'':<37}{line}\n"
+    return table
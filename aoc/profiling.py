@@ -0,0 +1,106 @@
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from typing import Any, Optional
+
+from aoc import Job, Solver, quiet
+
+
+class PeakSnapshot(threading.Thread):
+    """
+    Samples the traced allocations every `interval` seconds, keeping the
+    snapshot of the highest sample, so that the allocation sites are not only
+    the ones left after the part has returned and freed everything. A peak
+    between two samples is missed: on a short run the snapshot may be far
+    below it, as `peak` tells.
+    """
+
+    interval: float
+    peak: int
+    snapshot: Optional[tracemalloc.Snapshot]
+    _stop_event: threading.Event
+
+    def __init__(self, interval: float = 0.05) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self.snapshot = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        (current, _) = tracemalloc.get_traced_memory()
+        if current > self.peak or self.snapshot is None:
+            self.peak = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.check()
+
+
+def pstats_path(job: Job, directory: str) -> str:
+    return os.path.join(directory, job.key().replace("/", "-") + ".pstats")
+
+
+def profile_time(job: Job, directory: str, top: int) -> Any:
+    profiler = cProfile.Profile()
+    with quiet():
+        answer = profiler.runcall(job.run)
+
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(pstats_path(job, directory))
+    print(f"cProfile stats: {pstats_path(job, directory)}")
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return answer
+
+
+def profile_memory(job: Job, top: int) -> None:
+    tracemalloc.start()
+    peak_snapshot = PeakSnapshot()
+    peak_snapshot.start()
+    try:
+        with quiet():
+            job.run()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        peak_snapshot.stop()
+        tracemalloc.stop()
+
+    print(f"Peak traced memory: {peak / 1024:.1f} KiB")
+    assert peak_snapshot.snapshot is not None
+    snapshot = peak_snapshot.snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    print(
+        f"Top {top} allocation sites at the highest sample "
+        f"({peak_snapshot.peak / 1024:.1f} KiB traced, every "
+        f"{peak_snapshot.interval * 1000:g}ms):"
+    )
+    for stat in snapshot.statistics("lineno")[:top]:
+        print(f"  {stat}")
+
+
+def profile(job: Job, directory: str = "profiles", top: int = 20) -> Any:
+    """
+    Runs the job twice: under cProfile for the time spent per function, then
+    under tracemalloc for the memory, so neither skews the other.
+    """
+
+    print(f"== {job.label()} ==")
+    # The import is not part of the solution
+    Solver(job.day).module
+    answer = profile_time(job, directory, top)
+    profile_memory(job, top)
+    return answer
@@ -0,0 +1,127 @@
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from aoc import ROOT, Job, Solver, quiet
+
+T = TypeVar("T")
+
+
+class Sampler:
+    """
+    Records the Python stack every `interval` seconds of CPU time, from the
+    handler of SIGPROF. Unlike cProfile it does not hook every call, so the
+    generators and small helpers the solvers are built of are not slowed
+    down more than the rest.
+    """
+
+    interval: float
+    stacks: Counter[Tuple[str, ...]]
+    # Seconds spent in the handler
+    overhead: float
+    _root: Optional[FrameType]
+    _labels: Dict[CodeType, str]
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stacks = Counter()
+        self.overhead = 0
+        self._root = None
+        self._labels = {}
+
+    def label(self, code: CodeType) -> str:
+        try:
+            return self._labels[code]
+        except KeyError:
+            path = code.co_filename
+            if path.startswith(ROOT):
+                path = os.path.relpath(path, ROOT)
+            name = getattr(code, "co_qualname", code.co_name)
+            self._labels[code] = f"{path}:{name}"
+            return self._labels[code]
+
+    def sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        start = time.perf_counter()
+        stack: List[str] = []
+        while frame is not None and frame is not self._root:
+            stack.append(self.label(frame.f_code))
+            frame = frame.f_back
+        if stack:
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+        self.overhead += time.perf_counter() - start
+
+    def runcall(self, func: Callable[..., T], *args: Any) -> T:
+        # Stacks are recorded up to, not including, this frame
+        self._root = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func(*args)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            self._root = None
+
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        """
+        One `frame;frame;... count` line per stack, root first, as read by
+        flamegraph.pl, speedscope and inferno.
+        """
+
+        return "".join(
+            f"{';'.join(stack)} {count}\n"
+            for stack, count in sorted(self.stacks.items())
+        )
+
+    def self_samples(self) -> Counter[str]:
+        """
+        Samples by the function that was running, not waiting for a callee.
+        """
+
+        counts: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            counts[stack[-1]] += count
+        return counts
+
+
+def collapsed_path(job: Job, directory: str) -> str:
+    return os.path.join(directory, job.key().replace("/", "-") + ".collapsed")
+
+
+def sample(
+    job: Job, directory: str = "profiles", top: int = 20, interval: float = 0.001
+) -> Any:
+    print(f"== {job.label()} ==")
+    # The import is not part of the solution
+    Solver(job.day).module
+
+    sampler = Sampler(interval)
+    start = time.process_time()
+    with quiet():
+        answer = sampler.runcall(job.run)
+    elapsed = time.process_time() - start
+
+    os.makedirs(directory, exist_ok=True)
+    with open(collapsed_path(job, directory), "wt") as f:
+        f.write(sampler.collapsed())
+    print(f"Collapsed stacks: {collapsed_path(job, directory)}")
+
+    samples = sampler.samples()
+    overhead = sampler.overhead / elapsed if elapsed > 0 else 0
+    print(
+        f"{samples} samples every {interval * 1000:g}ms of CPU time, "
+        f"{overhead:.1%} of it spent sampling"
+    )
+    if samples > 0:
+        print(f"Top {top} functions by samples on top of the stack:")
+        for label, count in sampler.self_samples().most_common(top):
+            print(f"  {count / samples:>6.1%} {count:>8} {label}")
+    return answer
@@ -0,0 +1,244 @@
+"""
+Runs the selected parts on generated inputs of growing size, and fits how
+their time and peak memory grow with the size of the input, to catch the
+solvers that are accidentally quadratic before the inputs get big.
+
+python -m aoc.scaling [DAY ...] [-p PART ...] [--steps 5] [--factor 2]
+"""
+
+import argparse
+import functools
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from aoc import Job, Result, days
+from aoc.benchmark import Measurement, measure
+from aoc.budget import budgeted_solve
+from aoc.generate import GENERATORS, write
+from utils.progress import Progress
+
+# The generator size to start from, small enough for the first run to be quick
+# but large enough not to measure only the constant overhead
+START_SIZES: Dict[int, int] = {
+    1: 1000,
+    2: 1000,
+    3: 1000,
+    4: 500,
+    5: 500,
+    6: 2000,
+    7: 100,
+    8: 20,
+    9: 500,
+    10: 500,
+    11: 4,
+    12: 10,
+    13: 100,
+    14: 20,
+    15: 10,
+    16: 8,
+    17: 100,
+    18: 200,
+    20: 200,
+    21: 100,
+    22: 20,
+    23: 20,
+    25: 200,
+}
+
+
+@dataclass(frozen=True)
+class Step:
+    size: int
+    # Of the input file; the generators' sizes mean different things per day
+    bytes: int
+    measurement: Measurement
+
+
+def measured_solve(job: Job, repeat: int) -> Result:
+    start = time.perf_counter()
+    try:
+        # The warmup run imports the day
+        measurement = measure(job, repeat=repeat, warmup=1)
+        return Result(job, measurement, time.perf_counter() - start)
+    except NotImplementedError:
+        answer = "not implemented"
+    except Exception as e:
+        answer = f"failed: {e!r}"
+    return Result(job, answer, time.perf_counter() - start, ok=False)
+
+
+def ignore_progress(job: Job, progress: Progress) -> None:
+    pass
+
+
+def exponent(sizes: List[float], values: List[float]) -> float:
+    """
+    The slope of the least squares line through the points on a log-log
+    scale, i.e. k in value ~ size^k.
+    """
+
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(v, 1e-9)) for v in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def n_log_n_exponent(sizes: List[float]) -> float:
+    """
+    What n log n looks like over the same sizes, a bit more than 1.
+    """
+
+    return exponent(sizes, [n * math.log(n) for n in sizes])
+
+
+def scale(
+    day: int,
+    part: int,
+    directory: str,
+    steps: int = 5,
+    factor: int = 2,
+    repeat: int = 3,
+    max_seconds: float = 10,
+) -> List[Step]:
+    """
+    Measures the part on inputs `factor` times larger each step, stopping
+    early at the first one that fails or takes longer than `max_seconds`.
+    """
+
+    solve = functools.partial(measured_solve, repeat=repeat)
+    measured: List[Step] = []
+    size = START_SIZES.get(day, 100)
+    for _ in range(steps):
+        fn = os.path.join(directory, f"day{day}-{size}")
+        if not os.path.exists(fn):
+            write(fn, day, size, seed=0)
+        job = Job(day, part, fn)
+        result = budgeted_solve(
+            job, seconds=max_seconds, on_progress=ignore_progress, solve=solve
+        )
+        if not result.ok:
+            print(f"{job.key():<28} {size:>8}  {result.answer}", file=sys.stderr)
+            break
+        measurement: Measurement = result.answer
+        step = Step(size, os.path.getsize(fn), measurement)
+        measured.append(step)
+        print(
+            f"{job.key():<28} {size:>8} {step.bytes:>10}B "
+            f"{measurement.median * 1000:>10.2f}ms "
+            f"{measurement.peak_memory / 1024:>10.0f}KiB",
+            file=sys.stderr,
+        )
+        if measurement.median * (repeat + 2) > max_seconds:
+            break
+        size *= factor
+    return measured
+
+
+@dataclass(frozen=True)
+class Fit:
+    time: float
+    memory: float
+    n_log_n: float
+
+    def worse_than_n_log_n(self, tolerance: float) -> List[str]:
+        return [
+            name
+            for name, k in [("time", self.time), ("memory", self.memory)]
+            if k > self.n_log_n + tolerance
+        ]
+
+
+def fit(steps: List[Step]) -> Optional[Fit]:
+    if len(steps) < 3:
+        return None
+    sizes = [float(s.bytes) for s in steps]
+    return Fit(
+        time=exponent(sizes, [s.measurement.median for s in steps]),
+        memory=exponent(sizes, [float(s.measurement.peak_memory) for s in steps]),
+        n_log_n=n_log_n_exponent(sizes),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.scaling",
+        description="Fit how the parts' time and memory grow with the input.",
+    )
+    parser.add_argument(
+        "days", metavar="DAY", type=int, nargs="*", help="days to run (default: all)"
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, nargs="+", choices=[1, 2], default=[1, 2]
+    )
+    parser.add_argument("--steps", type=int, default=5, help="(default: 5)")
+    parser.add_argument(
+        "--factor",
+        type=int,
+        default=2,
+        help="growth of the input from one step to the next (default: 2)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="runs per size (default: 3)"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10,
+        help="stop growing a part's input once it takes this long (default: 10)",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="how much an exponent may exceed n log n's before it is flagged "
+        "(default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    selected = [day for day in args.days or days() if day in GENERATORS]
+    report = []
+    flagged = 0
+    with tempfile.TemporaryDirectory(prefix="aoc-scaling-") as directory:
+        for day in selected:
+            for part in args.part:
+                steps = scale(
+                    day,
+                    part,
+                    directory,
+                    steps=args.steps,
+                    factor=args.factor,
+                    repeat=args.repeat,
+                    max_seconds=args.max_seconds,
+                )
+                key = f"day{day}/part{part}"
+                exponents = fit(steps)
+                if exponents is None:
+                    report.append(f"{key:<12} too few sizes to fit ({len(steps)})")
+                    continue
+                worse = exponents.worse_than_n_log_n(args.tolerance)
+                flagged += bool(worse)
+                report.append(
+                    f"{key:<12} time ~ n^{exponents.time:<5.2f} "
+                    f"memory ~ n^{exponents.memory:<5.2f} "
+                    f"(n log n ~ n^{exponents.n_log_n:.2f})"
+                    + (f"  WORSE THAN n log n: {', '.join(worse)}" if worse else "")
+                )
+
+    print("\n".join(report))
+    if flagged:
+        print(f"{flagged} parts scale worse than n log n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
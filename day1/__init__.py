@@ -0,0 +1,46 @@
+import heapq
+from functools import reduce
+from typing import Generator, Iterator, List, Tuple
+
+from utils import file_lines
+
+
+def split_inventories(lines: Iterator[str]) -> Generator[List[int], None, None]:
+    inventory: List[int] = []
+    for line in lines:
+        if line == "":
+            yield inventory
+            inventory = []
+        else:
+            inventory += [int(line)]
+    yield inventory
+
+
+def sum_inventories(inventories: Iterator[List[int]]) -> Generator[int, None, None]:
+    for inventory in inventories:
+        yield reduce(lambda prev, curr: prev + curr, inventory, 0)
+
+
+def parse(input_fn: str) -> List[int]:
+    return list(sum_inventories(split_inventories(file_lines(input_fn))))
+
+
+def solve1(totals: List[int]) -> int:
+    return max(totals)
+
+
+def solve2(totals: List[int]) -> int:
+    return sum(sorted(totals, reverse=True)[0:3])
+
+
+def solve_both(totals: List[int]) -> Tuple[int, int]:
+    top3 = heapq.nlargest(3, totals)
+    return (top3[0], sum(top3))
+
+
+def part1(input_fn: str) -> int:
+    return solve1(parse(input_fn))
+
+
+def part2(input_fn: str) -> int:
+    return solve2(parse(input_fn))
@@ -0,0 +1,49 @@
+from typing import Generator, Iterator, List
+
+from utils import file_lines
+
+
+def cathode_ray(instructions: Iterator[str]) -> Generator[int, None, None]:
+    x = 1
+    for instruction in instructions:
+        if instruction.startswith("addx"):
+            add = int(instruction.split(" ")[1])
+            for _ in range(2):
+                yield x
+            x += add
+        elif instruction == "noop":
+            yield x
+        else:
+            assert False, instruction
+    yield x
+
+
+def parse(fn: str) -> List[int]:
+    return list(cathode_ray(file_lines(fn)))
+
+
+def solve1(states: List[int]) -> int:
+    interesting = [20, 60, 100, 140, 180, 220]
+    return sum(i * states[i - 1] for i in interesting)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def crt(cat_ray: Iterator[int]) -> str:
+    out = ""
+    for _ in range(6):
+        for x in range(40):
+            sprite_center = next(cat_ray)
+            out += "#" if sprite_center - 1 <= x <= sprite_center + 1 else "."
+        out += "\n"
+    return out
+
+
+def solve2(states: List[int]) -> str:
+    return crt(iter(states))
+
+
+def part2(fn: str) -> str:
+    return solve2(parse(fn))
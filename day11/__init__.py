@@ -0,0 +1,127 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from utils import checkpoint, file_lines, match_into_chunks
+
+
+def drop_prefix(line: str, prefix: str) -> str:
+    assert line.startswith(prefix)
+    return line[len(prefix) :]
+
+
+def parse_monkey_index(line: str) -> int:
+    line = drop_prefix(line, "Monkey ")
+    assert line.endswith(":")
+    return int(line[: -len(":")])
+
+
+def parse_items(line: str) -> List[int]:
+    return [int(i.strip()) for i in drop_prefix(line, "  Starting items: ").split(",")]
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    `new = old <operator> <operand>`, where no operand means `old`. Unlike an
+    eval'd lambda, it can be pickled into checkpoints.
+    """
+
+    operator: str
+    operand: Optional[int]
+
+    def __call__(self, old: int) -> int:
+        operand = old if self.operand is None else self.operand
+        return old * operand if self.operator == "*" else old + operand
+
+
+def parse_operation(line: str) -> Callable[[int], int]:
+    (left, operator, right) = drop_prefix(line, "  Operation: new = ").split(" ")
+    assert left == "old" and operator in ["*", "+"], line
+    return Operation(operator, None if right == "old" else int(right))
+
+
+def parse_divisor(line: str) -> int:
+    return int(drop_prefix(line, "  Test: divisible by "))
+
+
+def parse_true_dest(line: str) -> int:
+    return int(drop_prefix(line, "    If true: throw to monkey "))
+
+
+def parse_false_dest(line: str) -> int:
+    return int(drop_prefix(line, "    If false: throw to monkey "))
+
+
+@dataclass()
+class Monkey:
+    items: List[int]
+    operation: Callable[[int], int]
+    divisor: int
+    true_dest: int
+    false_dest: int
+    inspected: int = 0
+
+    def round(
+        self, monkeys: List["Monkey"], mod_base: int, dampen: bool = True
+    ) -> List["Monkey"]:
+        for item in self.items:
+            new_worry = (
+                int(math.floor(self.operation(item) / 3))
+                if dampen
+                else self.operation(item)
+            ) % mod_base
+            monkeys[
+                (self.true_dest if (new_worry % self.divisor == 0) else self.false_dest)
+            ].items.append(new_worry)
+            self.inspected += 1
+        self.items = []
+        return monkeys
+
+
+def parse_monkey(lines: List[str]) -> Monkey:
+    return Monkey(
+        items=parse_items(lines[1]),
+        operation=parse_operation(lines[2]),
+        divisor=parse_divisor(lines[3]),
+        true_dest=parse_true_dest(lines[4]),
+        false_dest=parse_false_dest(lines[5]),
+    )
+
+
+def print_round(i: int, monkeys: List[Monkey]) -> None:
+    print(f"After round {i}, the monkeys are holding items with these worry levels:")
+    for index, monkey in enumerate(monkeys):
+        print(f"Monkey {index}: {len(monkey.items)}")
+
+
+def monkey_business(fn: str, rounds: int, dampen: bool) -> int:
+    monkeys = [
+        parse_monkey(monkey_lines)
+        for monkey_lines in match_into_chunks(
+            file_lines(fn), lambda l: l == "", return_match=False
+        )
+    ]
+    mod_base = math.prod(m.divisor for m in monkeys)
+    simulation = checkpoint.Simulation(__name__, f"{rounds}/{dampen}", monkeys)
+    (start, monkeys) = simulation.resume(0, monkeys)
+    # print_round(0, monkeys)
+    for round_no in range(start, rounds):
+        for monkey in monkeys:
+            monkey.round(monkeys, mod_base, dampen=dampen)
+        # print_round(round_no + 1, monkeys)
+        if simulation.due():
+            simulation.save(round_no + 1, monkeys)
+    simulation.finish()
+    inspecteds = sorted([m.inspected for m in monkeys], reverse=True)
+    # print(inspecteds)
+    top_inspecteds = inspecteds[:2]
+    return math.prod(top_inspecteds)
+
+
+def part1(fn: str) -> int:
+    return monkey_business(fn, rounds=20, dampen=True)
+
+
+def part2(fn: str) -> int:
+    return monkey_business(fn, rounds=10000, dampen=False)
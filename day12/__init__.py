@@ -0,0 +1,102 @@
+from typing import List, Optional, Set, Tuple
+
+from utils import file_lines, metrics, search
+from utils.cache import cached_parse
+from utils.grid import Grid, adjacency
+from utils.matrix import cell_value, indices, matrix_to_str, read_matrix
+
+
+def height(cell: str) -> int:
+    if cell == "S":
+        return ord("a")
+    elif cell == "E":
+        return ord("z")
+    else:
+        return ord(cell)
+
+
+def shortest_path(
+    height_map: List[List[str]],
+    end_coords: Tuple[int, int],
+    start_coords: Optional[Set[Tuple[int, int]]] = None,
+) -> List[List[int]]:
+    """
+    The fewest steps from each cell to E, -1 where E is out of reach. Given
+    `start_coords`, the search stops at the first of them it reaches, leaving
+    the cells further from E at -1.
+    """
+
+    heights = Grid.from_matrix([[height(cell) for cell in row] for row in height_map])
+    # Walking down from E, so an edge goes to the neighbors that can climb here
+    graph = adjacency(heights, lambda here, there: here <= there + 1)
+
+    target = None
+    if start_coords is not None:
+        target = {graph.cell(x, y) for (x, y) in start_coords}.__contains__
+
+    def counted_neighbors(cell: int) -> List[int]:
+        # Each cell is expanded once, right after it comes off the frontier
+        metrics.count("day12.frontier.pop")
+        return graph.neighbors(cell)
+
+    neighbors = counted_neighbors if metrics.enabled else graph.neighbors
+    found = search.bfs([graph.cell(*end_coords)], neighbors, target)
+
+    distances = [-1] * (graph.rows * graph.cols)
+    for (cell, distance) in found.distances.items():
+        distances[cell] = distance
+    return [distances[x * graph.cols : (x + 1) * graph.cols] for x in range(graph.rows)]
+
+
+@cached_parse
+def parse(fn: str) -> List[List[str]]:
+    return read_matrix(file_lines(fn), lambda s: s)
+
+
+def coords_of(height_map: List[List[str]], cells: str) -> Set[Tuple[int, int]]:
+    return {(x, y) for (x, y) in indices(height_map) if height_map[x][y] in cells}
+
+
+def fewest_steps(distances: List[List[int]], start_coords: Set[Tuple[int, int]]) -> int:
+    return min(
+        [
+            dist
+            for dist in [
+                cell_value(distances, start_coord[0], start_coord[1])
+                for start_coord in start_coords
+            ]
+            if dist is not None and dist != -1
+        ]
+    )
+
+
+def solve1(height_map: List[List[str]]) -> int:
+    (end_coords,) = coords_of(height_map, "E")
+    start_coords = coords_of(height_map, "S")
+    distances = shortest_path(height_map, end_coords, start_coords)
+    return fewest_steps(distances, start_coords)
+
+
+def solve2(height_map: List[List[str]]) -> int:
+    (end_coords,) = coords_of(height_map, "E")
+    start_coords = coords_of(height_map, "Sa")
+    distances = shortest_path(height_map, end_coords, start_coords)
+    return fewest_steps(distances, start_coords)
+
+
+def solve_both(height_map: List[List[str]]) -> Tuple[int, int]:
+    # Both parts look for the way down from E, and only differ in where it ends
+    (end_coords,) = coords_of(height_map, "E")
+    distances = shortest_path(height_map, end_coords)
+    return (
+        fewest_steps(distances, coords_of(height_map, "S")),
+        fewest_steps(distances, coords_of(height_map, "Sa")),
+    )
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
@@ -0,0 +1,102 @@
+from itertools import zip_longest
+from typing import Generator, List, Tuple
+
+from utils import file_lines, match_into_chunks
+from utils.cache import cached_parse
+from functools import cmp_to_key
+
+StrangeNumber = int | List["StrangeNumber"] | None
+
+
+def pairs(fn: str) -> Generator[Tuple[StrangeNumber, StrangeNumber], None, None]:
+    for [left_str, right_str] in match_into_chunks(
+        file_lines(fn), lambda s: s == "", return_match=False
+    ):
+        left: StrangeNumber = eval(left_str)
+        right: StrangeNumber = eval(right_str)
+        yield (left, right)
+
+
+@cached_parse
+def parse(fn: str) -> List[Tuple[StrangeNumber, StrangeNumber]]:
+    return list(pairs(fn))
+
+
+def compare(left: StrangeNumber, right: StrangeNumber) -> int:
+    # -1: left is greater
+    # 0: equal
+    # 1: right is greater
+    match left:
+        case list():
+            match right:
+                case list():
+                    for (new_left, new_right) in zip_longest(
+                        left, right, fillvalue=None
+                    ):
+                        compare_result = compare(new_left, new_right)
+                        if compare_result != 0:
+                            return compare_result
+                    return 0
+                case int():
+                    return compare(left, [right])
+                case None:
+                    return 1
+        case int():
+            match right:
+                case list():
+                    return compare([left], right)
+                case int():
+                    if left < right:
+                        return -1
+                    elif left == right:
+                        return 0
+                    else:
+                        return 1
+                case None:
+                    return 1
+        case None:
+            match right:
+                case list():
+                    return -1
+                case int():
+                    return -1
+                case None:
+                    assert False, f"Should never get here, both left and right are None"
+
+
+def sum_indices_of_pairs_in_correct_order(
+    packet_pairs: List[Tuple[StrangeNumber, StrangeNumber]]
+) -> int:
+    return sum(
+        index + 1
+        for (index, (left, right)) in enumerate(packet_pairs)
+        if compare(left, right) == -1
+    )
+
+
+def solve1(packet_pairs: List[Tuple[StrangeNumber, StrangeNumber]]) -> int:
+    return sum_indices_of_pairs_in_correct_order(packet_pairs)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def solve2(packet_pairs: List[Tuple[StrangeNumber, StrangeNumber]]) -> int:
+    divider_2: StrangeNumber = [[2]]
+    divider_6: StrangeNumber = [[6]]
+    sorted_strange_nums: List[StrangeNumber] = sorted(
+        [packet for pair in packet_pairs for packet in pair]
+        + [
+            divider_2,
+            divider_6,
+        ],
+        key=cmp_to_key(compare),
+    )
+    return (sorted_strange_nums.index(divider_2) + 1) * (
+        sorted_strange_nums.index(divider_6) + 1
+    )
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
@@ -0,0 +1,123 @@
+from typing import Generator, Iterator, List, Optional
+
+from utils import file_lines, metrics, tracing
+from utils.geometry import HorizontalOrVerticalLine, Point, PointSet, draw_coordinates
+
+
+def lines(lines: Iterator[str]) -> Generator[HorizontalOrVerticalLine, None, None]:
+    for line in lines:
+        endpoints = line.split(" -> ")
+        for i in range(len(endpoints) - 1):
+            yield HorizontalOrVerticalLine(
+                Point.from_string(endpoints[i]), Point.from_string(endpoints[i + 1])
+            )
+
+
+class InletBlockedException(Exception):
+    pass
+
+
+class FellIntoAbyssException(Exception):
+    pass
+
+
+def collision(
+    x: int,
+    y: int,
+    line_points: PointSet,
+    sands: PointSet,
+    bottom: Optional[int] = None,
+) -> bool:
+    if metrics.enabled:
+        metrics.count("day14.collision")
+    if y == bottom:
+        return True
+    if sands.has(x, y):
+        return True
+    if line_points.has(x, y):
+        return True
+    return False
+
+
+def drop_sand(
+    line_points: PointSet,
+    sands: PointSet,
+    lowest: int,
+    bottom: Optional[int] = None,
+) -> Point:
+    # Plain coordinates, a Point is only made for where the sand rests
+    (x, y) = (500, 0)
+    while y < lowest:
+        # print(draw_pit(lines, sands))
+
+        (new_x, new_y) = (x, y + 1)
+
+        if collision(new_x, new_y, line_points, sands, bottom):
+            (new_x, new_y) = (x - 1, y + 1)
+
+            if collision(new_x, new_y, line_points, sands, bottom):
+                (new_x, new_y) = (x + 1, y + 1)
+
+                if collision(new_x, new_y, line_points, sands, bottom):
+                    if (x, y) == (500, 0):
+                        raise InletBlockedException(Point(x, y))
+                    else:
+                        return Point(x, y)
+
+        (x, y) = (new_x, new_y)
+
+    raise FellIntoAbyssException(Point(x, y))
+
+
+def lowest_point(lines: List[HorizontalOrVerticalLine]) -> int:
+    return max(l.high.y for l in lines)
+
+
+def draw_pit(line_points: PointSet, sands: PointSet) -> str:
+    return draw_coordinates(
+        points={
+            **{
+                Point(500, 0): "+",
+            },
+            **{sand: "s" for sand in sands},
+            **{lp: "#" for lp in line_points},
+        },
+    )
+
+
+def part1(fn: str) -> int:
+    with tracing.span("lines"):
+        ls = list(lines(file_lines(fn)))
+    lowest = lowest_point(ls)
+    with tracing.span("line_points"):
+        line_points = PointSet()
+        for l in ls:
+            line_points |= l.points()
+    sands = PointSet()
+
+    try:
+        with tracing.span("drop_sand"):
+            while True:
+                sands.add(drop_sand(line_points, sands, lowest))
+    except FellIntoAbyssException:
+        print(draw_pit(line_points, sands))
+        return len(sands)
+
+
+def part2(fn: str) -> int:
+    with tracing.span("lines"):
+        ls = list(lines(file_lines(fn)))
+    lowest = lowest_point(ls)
+    with tracing.span("line_points"):
+        line_points = PointSet()
+        for l in ls:
+            line_points |= l.points()
+    sands = PointSet()
+
+    try:
+        with tracing.span("drop_sand"):
+            while True:
+                sands.add(drop_sand(line_points, sands, lowest + 3, bottom=lowest + 2))
+    except InletBlockedException:
+        print(draw_pit(line_points, sands))
+        return len(sands) + 1
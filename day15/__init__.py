@@ -0,0 +1,73 @@
+import re
+from typing import Generator, List, Optional, Set, Tuple
+
+from utils import file_lines
+from utils.cache import cached_parse
+from utils.geometry import IntervalSet, Point
+
+
+def parse(line: str) -> Tuple[Point, Point]:
+    m = re.match(
+        r"^Sensor at x=(-?[0-9]+), y=(-?[0-9]+): closest beacon is at x=(-?[0-9]+), y=(-?[0-9]+)$",
+        line,
+    )
+    assert m is not None, f"Failed to parse line: {line}"
+    assert len(m.groups()) == 4, f"Failed to parse line: {line}"
+    return (
+        Point(int(m.group(1)), int(m.group(2))),
+        Point(int(m.group(3)), int(m.group(4))),
+    )
+
+
+def find_excluded_spots(
+    sensor: Point, closest: Point, line_y: int
+) -> Optional[Tuple[int, int]]:
+    distance = sensor.distance(closest)
+    distance_from_line = abs(sensor.y - line_y)
+    if distance < distance_from_line:
+        return None
+    width_of_cut_to_one_side = distance - distance_from_line
+    return (sensor.x - width_of_cut_to_one_side, sensor.x + width_of_cut_to_one_side)
+
+
+def beacons_on_line(beacons: Set[Point], line_y: int) -> int:
+    return len({b for b in beacons if b.y == line_y})
+
+
+def excluded_on_line(sensors: List[Tuple[Point, Point]], line_y: int) -> IntervalSet:
+    excluded = IntervalSet()
+    for sensor, closest in sensors:
+        spots = find_excluded_spots(sensor, closest, line_y)
+        if spots is not None:
+            excluded.add(*spots)
+    return excluded
+
+
+def part1(fn: str) -> int:
+    Y = 10 if fn.endswith("sample") else 2000000
+    sensors = parse_sensors(fn)
+    beacons = {closest for (_, closest) in sensors}
+    return excluded_on_line(sensors, Y).covered() - beacons_on_line(beacons, Y)
+
+
+def parse_lines(fn: str) -> Generator[Tuple[Point, Point], None, None]:
+    for l in file_lines(fn):
+        yield parse(l)
+
+
+@cached_parse
+def parse_sensors(fn: str) -> List[Tuple[Point, Point]]:
+    return list(parse_lines(fn))
+
+
+def part2(fn: str) -> int:
+    max_coord = 20 if fn.endswith("sample") else 4000000
+
+    sensors = parse_sensors(fn)
+
+    for y in range(0, max_coord + 1):
+        excluded = excluded_on_line(sensors, y)
+        for (spot, _) in excluded.gaps(0, max_coord):
+            return spot * 4000000 + y
+
+    assert False, "No available spot found"
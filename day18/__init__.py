@@ -0,0 +1,38 @@
+import numpy as np
+
+from utils import file_lines
+from utils.cache import cached_parse
+from utils.grid import Grid
+
+
+@cached_parse
+def parse(fn: str) -> Grid:
+    """
+    Whether each voxel is lava, with a layer of air all around the droplet.
+    """
+
+    cubes = np.array(
+        [[int(c) for c in line.split(",")] for line in file_lines(fn)], dtype=int
+    ).reshape(-1, 3)
+    lava = np.zeros(tuple(cubes.max(axis=0, initial=0) + 3), dtype=bool)
+    (x, y, z) = (cubes + 1).T
+    lava[x, y, z] = True
+    assert np.count_nonzero(lava) == len(cubes)
+    return Grid(lava)
+
+
+def solve1(lava: Grid) -> int:
+    return lava.faces(Grid(~lava.cells), outside=True)
+
+
+def solve2(lava: Grid) -> int:
+    steam = Grid(~lava.cells).flood(0, 0, 0)
+    return lava.faces(steam)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
@@ -0,0 +1,174 @@
+from typing import Iterator, List, Optional
+
+from utils import checkpoint, file_lines
+
+
+class ElemIterator(Iterator["Elem"]):
+    first: "Elem"
+    curr: Optional["Elem"]
+
+    def __init__(self, elem: "Elem") -> None:
+        super().__init__()
+        self.first = elem
+        self.curr = None
+
+    def __next__(self) -> "Elem":
+        if self.curr == self.first:
+            raise StopIteration
+
+        if self.curr is None:
+            self.curr = self.first
+
+        curr = self.curr
+        self.curr = curr.next
+        return curr
+
+
+class Elem:
+    prev: Optional["Elem"]
+    next: Optional["Elem"]
+    value: int
+
+    def __init__(self, value: int, prev: Optional["Elem"]):
+        self.value = value
+        self.prev = prev
+        self.next = None
+
+    def to_list(self) -> List[int]:
+        return [e.value for e in iter(self)]
+
+    def to_elem_list(self) -> List["Elem"]:
+        return [e for e in iter(self)]
+
+    def __iter__(self) -> ElemIterator:
+        return ElemIterator(self)
+
+    @staticmethod
+    def from_file(fn: str, decryption_key: int = 1) -> "Elem":
+        return Elem.from_values(parse(fn), decryption_key)
+
+    @staticmethod
+    def from_values(values: List[int], decryption_key: int = 1) -> "Elem":
+        numbers = iter(values)
+        head = Elem(next(numbers) * decryption_key, None)
+        prev = head
+        for n in numbers:
+            prev.next = Elem(n * decryption_key, prev)
+            prev = prev.next
+        prev.next = head
+        head.prev = prev
+        return head
+
+    @staticmethod
+    def ring_order(elems: List["Elem"]) -> List[int]:
+        """
+        The indices of the elements as they follow each other in the ring.
+        """
+
+        index = {id(e): i for i, e in enumerate(elems)}
+        return [index[id(e)] for e in iter(elems[0])]
+
+    @staticmethod
+    def relink(elems: List["Elem"]) -> None:
+        """
+        Links the elements into a ring in the given order.
+        """
+
+        for prev, next in zip(elems, elems[1:] + elems[:1]):
+            prev.next = next
+            next.prev = prev
+
+    def mix(self, list_length: int) -> None:
+        # Whole laps around the others end where they started
+        if self.value % (list_length - 1) == 0:
+            return
+
+        prev = self.prev
+        next = self.next
+
+        assert prev is not None
+        assert next is not None
+
+        prev.next = next
+        next.prev = prev
+
+        curr = self
+
+        if self.value > 0:
+            curr = self.nth(self.value % (list_length - 1))
+            self.next = curr.next
+            self.prev = curr
+            curr.next = self
+            assert self.next is not None
+            self.next.prev = self
+        else:
+            curr = self.nth(self.value % (list_length - 1) + 1)
+            self.prev = curr.prev
+            self.next = curr
+            assert curr.prev is not None
+            curr.prev.next = self
+            curr.prev = self
+
+    def nth(self, n: int) -> "Elem":
+        if n == 0:
+            return self
+        elif n > 0:
+            curr = self
+            for _ in range(n):
+                assert curr.next is not None
+                curr = curr.next
+            return curr
+        else:
+            curr = self
+            for _ in range(abs(n)):
+                assert curr.prev is not None
+                curr = curr.prev
+            return curr
+
+
+def parse(fn: str) -> List[int]:
+    return [int(l) for l in file_lines(fn)]
+
+
+def solve1(numbers: List[int]) -> int:
+    ring = Elem.from_values(numbers)
+    orig_order = ring.to_elem_list()
+    zero: Optional[Elem] = None
+
+    for e in orig_order:
+        e.mix(len(orig_order))
+        if e.value == 0:
+            zero = e
+
+    assert zero is not None
+    groove_coords = [zero.nth(n).value for n in [1000, 2000, 3000]]
+    print(groove_coords)
+    return sum(groove_coords)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def solve2(numbers: List[int]) -> int:
+    ring = Elem.from_values(numbers, decryption_key=811589153)
+    orig_order = ring.to_elem_list()
+
+    simulation = checkpoint.Simulation(__name__, "part2", numbers)
+    (start, order) = simulation.resume(0, Elem.ring_order(orig_order))
+    Elem.relink([orig_order[i] for i in order])
+
+    for mixed in range(start, 10):
+        for e in orig_order:
+            e.mix(len(orig_order))
+        if simulation.due():
+            simulation.save(mixed + 1, Elem.ring_order(orig_order))
+    simulation.finish()
+
+    zero = next(e for e in orig_order if e.value == 0)
+    groove_coords = [zero.nth(n).value for n in [1000, 2000, 3000]]
+    return sum(groove_coords)
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
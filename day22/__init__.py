@@ -0,0 +1,423 @@
+from enum import Enum
+from typing import Dict, Generator, List, Optional, Tuple
+
+from utils import file_lines
+from utils.matrix import FlatGrid
+
+
+class MazeCell(Enum):
+    void = " "
+    wall = "#"
+    open = "."
+
+
+class Direction(Enum):
+    up = "^"
+    down = "v"
+    left = "<"
+    right = ">"
+
+
+class HitAWallException(Exception):
+    pass
+
+
+class WrapAroundHorizontallyToTheLeftException(Exception):
+    pass
+
+
+class WrapAroundHorizontallyToTheRightException(Exception):
+    pass
+
+
+class WrapAroundVerticallyToTheTopException(Exception):
+    pass
+
+
+class WrapAroundVerticallyToTheBottomException(Exception):
+    pass
+
+
+VOID = ord(MazeCell.void.value)
+CELLS = {ord(c.value): c for c in MazeCell}
+
+
+def ends(line: memoryview) -> Tuple[int, int]:
+    """
+    The first and last index of the cells of the line that are not void.
+    """
+
+    void = bytes([VOID])
+    cells = line.tobytes()
+    first = len(cells) - len(cells.lstrip(void))
+    last = len(cells.rstrip(void)) - 1
+    return (first, last) if first <= last else (0, 0)
+
+
+class Maze:
+    # A border of void puts the first cell at (1, 1), as the puzzle counts them
+    _maze: FlatGrid
+    _row_ends: List[Tuple[int, int]]
+    _col_ends: List[Tuple[int, int]]
+    # Flat index offset of a step in each direction
+    _steps: Dict[Direction, int]
+
+    def __init__(self, maze: List[str]) -> None:
+        self._maze = FlatGrid.from_lines(maze, fill=MazeCell.void.value, border=1)
+        assert not self._maze.cells.translate(None, bytes(CELLS)), "Unknown cell"
+        # Where to wrap around to, the same on every lap
+        self._row_ends = [ends(self._maze.row(row)) for row in range(self._maze.height)]
+        self._col_ends = [ends(self._maze.col(col)) for col in range(self._maze.width)]
+        (up, down, left, right) = self._maze.offsets
+        self._steps = {
+            Direction.up: up,
+            Direction.down: down,
+            Direction.left: left,
+            Direction.right: right,
+        }
+
+    def first_cell_from_left(self, row: int) -> Tuple[Tuple[int, int], MazeCell]:
+        assert row > 0
+        pos = (row, self._row_ends[row][0])
+        return (pos, self.cell(pos))
+
+    def first_cell_from_right(self, row: int) -> Tuple[Tuple[int, int], MazeCell]:
+        assert row > 0
+        pos = (row, self._row_ends[row][1])
+        return (pos, self.cell(pos))
+
+    def first_cell_from_top(self, col: int) -> Tuple[Tuple[int, int], MazeCell]:
+        assert col > 0
+        pos = (self._col_ends[col][0], col)
+        return (pos, self.cell(pos))
+
+    def first_cell_from_bottom(self, col: int) -> Tuple[Tuple[int, int], MazeCell]:
+        assert col > 0
+        pos = (self._col_ends[col][1], col)
+        return (pos, self.cell(pos))
+
+    def start_cell(self) -> Tuple[int, int]:
+        (pos, cell) = self.first_cell_from_left(1)
+        assert cell == MazeCell.open
+        return pos
+
+    def cell(self, pos: Tuple[int, int]) -> MazeCell:
+        """
+        Rows start from 1 at the top and count downward;
+        columns start from 1 at the left and count rightward.
+        """
+
+        (row, col) = pos
+        if not (0 <= row < self._maze.height and 0 <= col < self._maze.width):
+            return MazeCell.void
+        return CELLS[self._maze[row, col]]
+
+    def move(
+        self, position: Tuple[int, int], direction: Direction
+    ) -> Tuple[Tuple[int, int], Direction]:
+        # Positions are always on the board, so a step lands at most on the
+        # border and never wraps around to another row
+        index = self._maze.index(*position) + self._steps[direction]
+        (new_row, new_col) = self._maze.coords(index)
+        c = CELLS[self._maze.cells[index]]
+
+        match c:
+            case MazeCell.open:
+                return ((new_row, new_col), direction)
+            case MazeCell.wall:
+                raise HitAWallException((new_row, new_col))
+            case MazeCell.void:
+                ((pos, cell), new_direction) = self.teleport(
+                    (new_row, new_col), direction
+                )
+                match cell:
+                    case MazeCell.wall:
+                        raise HitAWallException(pos)
+                    case MazeCell.open:
+                        return (pos, new_direction)
+                    case _:
+                        assert False
+
+    def teleport(
+        self, new_pos: Tuple[int, int], direction: Direction
+    ) -> Tuple[Tuple[Tuple[int, int], MazeCell], Direction]:
+        (new_row, new_col) = new_pos
+        match direction:
+            case Direction.right:
+                return (self.first_cell_from_left(new_row), direction)
+            case Direction.up:
+                return (self.first_cell_from_bottom(new_col), direction)
+            case Direction.left:
+                return (self.first_cell_from_right(new_row), direction)
+            case Direction.down:
+                return (self.first_cell_from_top(new_col), direction)
+            case _:
+                assert False
+
+    def to_string(self, me: Optional["Me"]) -> str:
+        string = ""
+        for row in range(1, self._maze.height - 1):
+            line = ""
+            for col in range(1, self._maze.width - 1):
+                c = self.cell((row, col))
+                if me is not None and me.position == (row, col):
+                    assert c == MazeCell.open
+                    line += f"\033[93m{str(me)}\033[0m"
+                    continue
+                line += c.value
+            string += line.rstrip(" ") + "\n"
+        return string
+
+    def __repr__(self) -> str:
+        return self.to_string(None)
+
+
+class Me:
+    position: Tuple[int, int]
+    direction: Direction
+
+    def __init__(self, row: int, col: int) -> None:
+        self.position = (row, col)
+        self.direction = Direction.right
+
+    def __repr__(self) -> str:
+        return str(self.direction.value)
+
+    def move_forward(self, steps: int, maze: Maze) -> None:
+        try:
+            for _ in range(steps):
+                (self.position, self.direction) = maze.move(
+                    self.position, self.direction
+                )
+        except HitAWallException:
+            pass
+
+    def turn(self, direction: str) -> None:
+        assert direction in ["R", "L"]
+        match direction:
+            case "R":
+                match self.direction:
+                    case Direction.up:
+                        self.direction = Direction.right
+                    case Direction.right:
+                        self.direction = Direction.down
+                    case Direction.down:
+                        self.direction = Direction.left
+                    case Direction.left:
+                        self.direction = Direction.up
+            case "L":
+                match self.direction:
+                    case Direction.up:
+                        self.direction = Direction.left
+                    case Direction.left:
+                        self.direction = Direction.down
+                    case Direction.down:
+                        self.direction = Direction.right
+                    case Direction.right:
+                        self.direction = Direction.up
+
+    def password(self) -> int:
+        """
+        Facing is 0 for right (>), 1 for down (v), 2 for left (<), and 3 for up (^).
+        The final password is the sum of 1000 times the row, 4 times the column, and the facing.
+        """
+
+        facing = -1
+        match self.direction:
+            case Direction.right:
+                facing = 0
+            case Direction.down:
+                facing = 1
+            case Direction.left:
+                facing = 2
+            case Direction.up:
+                facing = 3
+        assert facing != -1
+        (row, col) = self.position
+        return 1000 * row + 4 * col + facing
+
+
+def instructions(line: str) -> Generator[int | str, None, None]:
+    tmp: str = ""
+    for c in line:
+        try:
+            int(c)
+            tmp += c
+        except ValueError:
+            yield int(tmp)
+            tmp = ""
+            yield c
+    assert tmp != ""
+    yield int(tmp)
+
+
+def parse(fn: str) -> Tuple[List[str], str]:
+    input_lines = list(file_lines(fn))
+    return (input_lines[:-2], input_lines[-1])
+
+
+def part1(fn: str) -> int:
+    (cells, path) = parse(fn)
+    maze = Maze(cells)
+    me = Me(*maze.start_cell())
+
+    for instr in instructions(path):
+        # print(f"Instruction: {instr}")
+        match instr:
+            case int():
+                me.move_forward(instr, maze)
+            case str():
+                me.turn(instr)
+        # print(f"After instruction '{instr}':\n{maze.to_string(me)}")
+
+    return me.password()
+
+
+class MazeCube(Maze):
+    def teleport(
+        self, from_pos: Tuple[int, int], direction: Direction
+    ) -> Tuple[Tuple[Tuple[int, int], MazeCell], Direction]:
+        (row, col) = from_pos
+
+        match direction:
+            case Direction.left:
+                if col == 50 and 1 <= row <= 50:
+                    new_row = 100 + (51 - row)
+                    new_col = 1
+                    new_direction = Direction.right
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 50 and 51 <= row <= 100:
+                    new_row = 101
+                    new_col = row - 50
+                    new_direction = Direction.down
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 0 and 101 <= row <= 150:
+                    new_row = 100 + 51 - row
+                    new_col = 51
+                    new_direction = Direction.right
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 0 and 151 <= row <= 200:
+                    new_row = 1
+                    new_col = row - 100
+                    new_direction = Direction.down
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                else:
+                    assert False
+            case Direction.up:
+                if row == 100 and 1 <= col <= 50:
+                    new_col = 51
+                    new_row = col + 50
+                    new_direction = Direction.right
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif row == 0 and 51 <= col <= 100:
+                    new_col = 1
+                    new_row = col + 100
+                    new_direction = Direction.right
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif row == 0 and 101 <= col <= 150:
+                    new_direction = Direction.up
+                    new_row = 200
+                    new_col = col - 100
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                else:
+                    assert False
+            case Direction.right:
+                if col == 151 and 1 <= row <= 50:
+                    new_row = 151 - row
+                    new_col = 100
+                    new_direction = Direction.left
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 101 and 51 <= row <= 100:
+                    new_row = 50
+                    new_col = row + 50
+                    new_direction = Direction.up
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 101 and 101 <= row <= 150:
+                    new_row = 151 - row
+                    new_col = 150
+                    new_direction = Direction.left
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif col == 51 and 151 <= row <= 200:
+                    new_row = 150
+                    new_col = row - 100
+                    new_direction = Direction.up
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                else:
+                    assert False
+            case Direction.down:
+                if row == 201 and 1 <= col <= 50:
+                    new_row = 1
+                    new_col = col + 100  # ?
+                    new_direction = Direction.down
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif row == 151 and 51 <= col <= 100:
+                    new_row = col + 100
+                    new_col = 50
+                    new_direction = Direction.left
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                elif row == 51 and 101 <= col <= 150:
+                    new_row = col - 50
+                    new_col = 100
+                    new_direction = Direction.left
+                    return (
+                        ((new_row, new_col), self.cell((new_row, new_col))),
+                        new_direction,
+                    )
+                else:
+                    assert False
+
+
+def part2(fn: str) -> int:
+    (cells, path) = parse(fn)
+    maze = MazeCube(cells)
+    me = Me(*maze.start_cell())
+
+    for instr in instructions(path):
+        # print(f"Instruction: {instr}")
+        match instr:
+            case int():
+                me.move_forward(instr, maze)
+            case str():
+                me.turn(instr)
+        # print(f"After instruction '{instr}':\n{maze.to_string(me)}")
+
+    return me.password()
@@ -0,0 +1,72 @@
+from functools import reduce
+from typing import List, Set, Tuple
+
+from utils import chunks, file_lines
+
+
+def split_in_half(line: str) -> Tuple[str, str]:
+    length = len(line)
+    return line[: int(length / 2)], line[int(length / 2) :]
+
+
+def to_ord_set(comp: str) -> Set[int]:
+    return {ord(ch) for ch in comp}
+
+
+def find_common(compartments: List[str]) -> Set[int]:
+    assert len(compartments) >= 2
+    return reduce(
+        lambda prev, curr: prev & to_ord_set(curr),
+        compartments[1:],
+        to_ord_set(compartments[0]),
+    )
+
+
+def ord_to_prio(ord: int) -> int:
+    if 97 <= ord <= 122:
+        return ord - 96
+    else:
+        return ord - 38
+
+
+def parse(fn: str) -> List[str]:
+    return list(file_lines(fn))
+
+
+def solve1(rucksacks: List[str]) -> int:
+    return sum(
+        [
+            ord_to_prio(find_common(list(split_in_half(line))).pop())
+            for line in rucksacks
+        ]
+    )
+
+
+def solve2(rucksacks: List[str]) -> int:
+    return sum(
+        [
+            ord_to_prio(find_common(list(group)).pop())
+            for group in chunks(iter(rucksacks), 3, "")
+        ]
+    )
+
+
+def solve_both(rucksacks: List[str]) -> Tuple[int, int]:
+    (misplaced, badges) = (0, 0)
+    group: List[str] = []
+    for line in rucksacks:
+        misplaced += ord_to_prio(find_common(list(split_in_half(line))).pop())
+        group.append(line)
+        if len(group) == 3:
+            badges += ord_to_prio(find_common(group).pop())
+            group = []
+    assert group == []
+    return (misplaced, badges)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
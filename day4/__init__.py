@@ -0,0 +1,69 @@
+from typing import List, Tuple
+
+from utils import file_lines
+from utils.geometry import IntervalSet
+
+
+def parse_assignment(line: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    (range1, range2) = line.split(",")
+
+    def range_str_to_start_end(range: str) -> Tuple[int, int]:
+        (start, end) = range.split("-")
+        return (int(start), int(end))
+
+    return (range_str_to_start_end(range1), range_str_to_start_end(range2))
+
+
+def subset(range1: Tuple[int, int], range2: Tuple[int, int]) -> bool:
+    return IntervalSet([range1]).contains(*range2)
+
+
+def subset_any_way(range1: Tuple[int, int], range2: Tuple[int, int]) -> bool:
+    return subset(range1, range2) or subset(range2, range1)
+
+
+Assignment = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def parse(file_name: str) -> List[Assignment]:
+    return [parse_assignment(line) for line in file_lines(file_name)]
+
+
+def solve1(assignments: List[Assignment]) -> int:
+    count = 0
+    for assignment in assignments:
+        if subset_any_way(*assignment):
+            count += 1
+    return count
+
+
+def part1(file_name: str) -> int:
+    return solve1(parse(file_name))
+
+
+def is_overlapping(range1: Tuple[int, int], range2: Tuple[int, int]) -> bool:
+    return IntervalSet([range1]).overlaps(*range2)
+
+
+def solve2(assignments: List[Assignment]) -> int:
+    count = 0
+    for assignment in assignments:
+        if is_overlapping(*assignment):
+            count += 1
+    return count
+
+
+def solve_both(assignments: List[Assignment]) -> Tuple[int, int]:
+    (subsets, overlaps) = (0, 0)
+    for assignment in assignments:
+        if subset_any_way(*assignment):
+            # A subset overlaps as well
+            subsets += 1
+            overlaps += 1
+        elif is_overlapping(*assignment):
+            overlaps += 1
+    return (subsets, overlaps)
+
+
+def part2(file_name: str) -> int:
+    return solve2(parse(file_name))
@@ -0,0 +1,48 @@
+from typing import List, Tuple
+
+from utils import file_lines
+
+
+def start_of_packet_marker_end_index(
+    input: str, packet_length: int = 4, start: int = 0
+) -> int:
+    for i in range(max(packet_length - 1, start), len(input)):
+        if len(set(input[i - (packet_length - 1) : i + 1])) == packet_length:
+            return i + 1
+
+    assert False, "Start of packet marker not present"
+
+
+def parse(file_name: str) -> List[str]:
+    return list(file_lines(file_name))
+
+
+def solve1(inputs: List[str]) -> List[int]:
+    return [start_of_packet_marker_end_index(input) for input in inputs]
+
+
+def solve2(inputs: List[str]) -> List[int]:
+    return [
+        start_of_packet_marker_end_index(input, packet_length=14) for input in inputs
+    ]
+
+
+def solve_both(inputs: List[str]) -> Tuple[List[int], List[int]]:
+    (packets, messages) = ([], [])
+    for input in inputs:
+        packet = start_of_packet_marker_end_index(input)
+        packets.append(packet)
+        # 14 different characters end with 4 different ones, so the message
+        # marker can not end before the packet marker
+        messages.append(
+            start_of_packet_marker_end_index(input, packet_length=14, start=packet - 1)
+        )
+    return (packets, messages)
+
+
+def part1(file_name: str) -> List[int]:
+    return solve1(parse(file_name))
+
+
+def part2(file_name: str) -> List[int]:
+    return solve2(parse(file_name))
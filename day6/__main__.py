@@ -1,26 +1,4 @@
-from typing import List
-
-from utils import file_lines
-
-
-def start_of_packet_marker_end_index(input: str, packet_length: int = 4) -> int:
-    for i in range(packet_length - 1, len(input)):
-        if len(set(input[i - (packet_length - 1) : i + 1])) == packet_length:
-            return i + 1
-
-    assert False, "Start of packet marker not present"
-
-
-def part1(file_name: str) -> List[int]:
-    return [start_of_packet_marker_end_index(input) for input in file_lines(file_name)]
-
-
-def part2(file_name: str) -> List[int]:
-    return [
-        start_of_packet_marker_end_index(input, packet_length=14)
-        for input in file_lines(file_name)
-    ]
-
+from day6 import part1, part2
 
 print(f"Part1 Sample: {part1('day6/sample')}")
 print(f"Part1: {part1('day6/input')}")
@@ -0,0 +1,53 @@
+from typing import Iterable
+
+import numpy as np
+
+from utils import file_lines
+from utils.grid import Grid
+from utils.matrix import FlatGrid, read_matrix
+
+
+def visible_in_forest(forest: Grid) -> Grid:
+    visible = np.zeros(forest.shape, dtype=bool)
+    for (axis, step) in forest.directions():
+        # The tallest tree between this one and the edge in that direction
+        tallest = forest.running_max(axis, reverse=step > 0).neighbor(axis, step, -1)
+        visible |= forest.cells > tallest.cells
+    return Grid(visible)
+
+
+def part1(fn: str) -> int:
+    forest = Grid.from_matrix(read_matrix(file_lines(fn), int))
+    visible = visible_in_forest(forest)
+    return int(np.count_nonzero(visible.cells))
+
+
+def viewing_distance(line_of_sight: Iterable[int], height: int) -> int:
+    los = 0
+    for e in line_of_sight:
+        if e < height:
+            los += 1
+        else:
+            los += 1
+            return los
+    return los
+
+
+def scenic_score(forest: FlatGrid, row: int, col: int) -> int:
+    height = forest[row, col]
+    return (
+        viewing_distance(forest.left_of(row, col), height)
+        * viewing_distance(forest.right_of(row, col), height)
+        * viewing_distance(forest.up_of(row, col), height)
+        * viewing_distance(forest.down_of(row, col), height)
+    )
+
+
+def part2(fn: str) -> int:
+    forest = FlatGrid(read_matrix(file_lines(fn), int))
+
+    return max(
+        scenic_score(forest, row, col)
+        for row in range(forest.height)
+        for col in range(forest.width)
+    )
@@ -0,0 +1,109 @@
+from typing import Dict, Generator, List, Set, Tuple
+
+from utils import file_lines
+
+# from utils.geometry import draw_coordinates
+
+
+def move_tail(head_pos: Tuple[int, int], tail_pos: Tuple[int, int]) -> Tuple[int, int]:
+    (head_x, head_y) = head_pos
+    (tail_x, tail_y) = tail_pos
+
+    d_x = head_x - tail_x
+    d_y = head_y - tail_y
+
+    if abs(d_x) < 2 and abs(d_y) < 2:
+        return tail_pos
+
+    mov_x = 0 if d_x == 0 else int(d_x / abs(d_x))
+    mov_y = 0 if d_y == 0 else int(d_y / abs(d_y))
+
+    return (tail_x + mov_x, tail_y + mov_y)
+
+
+def move_head(head_pos: Tuple[int, int], dir: str) -> Tuple[int, int]:
+    return {
+        "U": (head_pos[0] + 1, head_pos[1]),
+        "D": (head_pos[0] - 1, head_pos[1]),
+        "R": (head_pos[0], head_pos[1] + 1),
+        "L": (head_pos[0], head_pos[1] - 1),
+    }[dir]
+
+
+def rope_head_segment() -> Generator[
+    Tuple[Tuple[int, int], Tuple[int, int]], str, None
+]:
+    head_pos = (0, 0)
+    tail_pos = (0, 0)
+
+    while True:
+        dir = yield (head_pos, tail_pos)
+
+        head_pos = move_head(head_pos, dir)
+        tail_pos = move_tail(head_pos, tail_pos)
+
+
+def parse(fn: str) -> List[Tuple[str, int]]:
+    return [
+        (dir, int(count)) for (dir, count) in (l.split(" ") for l in file_lines(fn))
+    ]
+
+
+def solve1(moves: List[Tuple[str, int]]) -> int:
+    gen = rope_head_segment()
+    tail_pos = next(gen)[1]
+    tail_poss = {tail_pos}
+    for (dir, count) in moves:
+        for _ in range(count):
+            tail_pos = gen.send(dir)[1]
+            tail_poss.add(tail_pos)
+    return len(tail_poss)
+
+
+def rope_segment() -> Generator[
+    Tuple[Tuple[int, int], Tuple[int, int]], Tuple[int, int], None
+]:
+    head_pos = (0, 0)
+    tail_pos = (0, 0)
+
+    while True:
+        head_pos = yield (head_pos, tail_pos)
+        tail_pos = move_tail(head_pos, tail_pos)
+
+
+def part1(fn: str) -> int:
+    return solve1(parse(fn))
+
+
+def solve2(moves: List[Tuple[str, int]]) -> int:
+    return solve_both(moves)[1]
+
+
+def solve_both(moves: List[Tuple[str, int]]) -> Tuple[int, int]:
+    head = rope_head_segment()
+    next(head)
+    segments = [rope_segment() for i in range(9)]
+    [next(segment) for segment in segments]
+    # The tail of the first segment is the tail of the rope of part 1
+    short_tail_poss: Set[Tuple[int, int]] = {(0, 0)}
+    tail_poss: Set[Tuple[int, int]] = {(0, 0)}
+    for (dir, count) in moves:
+        for i in range(count):
+            coords: Dict[Tuple[int, int], str] = {(0, 0): "s"}
+            head_head, head_tail = head.send(dir)
+            short_tail_poss.add(head_tail)
+            next_segment_head = head_tail
+            coords[head_head] = "H"
+            for index, segment in enumerate(segments):
+                segment_head, segment_tail = segment.send(next_segment_head)
+                coords[segment_head] = f"{index + 1}"
+                next_segment_head = segment_tail
+                if index + 1 == 9:
+                    tail_poss.add(segment_head)
+    #            if i == count - 1:
+    #                print(draw_coordinates(coords))
+    return (len(short_tail_poss), len(tail_poss))
+
+
+def part2(fn: str) -> int:
+    return solve2(parse(fn))
@@ -1,3 +1,8 @@
+import bz2
+import gzip
+import io
+import lzma
+import sys
 from itertools import islice, tee, zip_longest
 from typing import Any, Callable, Dict, Generator, Iterator, List, Tuple, TypeVar
 
@@ -20,10 +25,58 @@ def hex_to_bin_str(str: str) -> str:
     return bin_str
 
 
+def open_input(fn: str) -> io.BufferedReader:
+    """
+    Opens a file, a pipe, or stdin (`-`) for reading.
+    """
+
+    raw = (
+        io.FileIO(sys.stdin.fileno(), "rb", closefd=False)
+        if fn == "-"
+        else io.FileIO(fn, "rb")
+    )
+    return io.BufferedReader(raw, buffer_size=1 << 16)
+
+
+def decompressed(
+    raw: io.BufferedReader,
+) -> io.BufferedReader | gzip.GzipFile | bz2.BZ2File | lzma.LZMAFile:
+    """
+    Decompresses gzip, bzip2 and xz contents on the fly, passes anything else.
+    """
+
+    # Peeking does not consume anything, so it works on pipes as well
+    magic = raw.peek(6)[:6]
+    if magic.startswith(b"\x1f\x8b"):
+        return gzip.GzipFile(fileobj=raw)
+    elif magic.startswith(b"BZh"):
+        return bz2.BZ2File(raw)
+    elif magic.startswith(b"\xfd7zXZ\x00"):
+        return lzma.LZMAFile(raw)
+    else:
+        return raw
+
+
 def file_lines(fn: str) -> Generator[str, None, None]:
-    with open(fn, "rt") as f:
-        for line in f.read().splitlines():
-            yield line
+    """
+    Reads a chunk at a time, so memory use does not depend on the size of the
+    input, only on its longest line.
+    """
+
+    with open_input(fn) as raw, io.TextIOWrapper(decompressed(raw)) as f:
+        # Parts of a line that spans chunks
+        pending: List[str] = []
+        for chunk in iter(lambda: f.read(1 << 16), ""):
+            lines = chunk.split("\n")
+            if len(lines) > 1:
+                pending.append(lines[0])
+                yield "".join(pending)
+                yield from lines[1:-1]
+                pending = []
+            pending.append(lines[-1])
+        last = "".join(pending)
+        if last != "":
+            yield last
 
 
 def all_pairs(lst: List[T]) -> Generator[Tuple[T, T], None, None]:
@@ -35,8 +88,9 @@ def all_pairs(lst: List[T]) -> Generator[Tuple[T, T], None, None]:
 
 def all_pairs_order_invariant(lst: List[T]) -> Generator[Tuple[T, T], None, None]:
     for idx, p1 in enumerate(lst):
-        for p2 in lst[idx:]:
-            yield (p1, p2)
+        # Indexing, as slicing would copy the rest of the list for every item
+        for idx2 in range(idx, len(lst)):
+            yield (p1, lst[idx2])
 
 
 def take(iterator: Iterator[T], n: int) -> Generator[T, None, None]:
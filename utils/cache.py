@@ -0,0 +1,201 @@
+import ast
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Dict, Generator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def file_digest(fn: str) -> str:
+    h = hashlib.sha256()
+    with open(fn, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def module_file(module_name: str) -> Optional[str]:
+    """
+    The source file of a module of this repo, None for anything else (stdlib,
+    site-packages).
+    """
+
+    path = os.path.join(ROOT, *module_name.split("."))
+    for candidate in [path + ".py", os.path.join(path, "__init__.py")]:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def imported_module_names(source: str) -> Generator[str, None, None]:
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            yield node.module
+            # `from package import module`
+            for alias in node.names:
+                yield f"{node.module}.{alias.name}"
+
+
+def source_files(module_name: str) -> Dict[str, str]:
+    """
+    The source files of the module and of every module of this repo it imports,
+    directly or through others, keyed by module name.
+    """
+
+    files: Dict[str, str] = {}
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        parts = name.split(".")
+        # Importing a.b runs a/__init__.py as well
+        for i in range(1, len(parts) + 1):
+            parent = ".".join(parts[:i])
+            fn = module_file(parent)
+            if parent in files or fn is None:
+                continue
+            files[parent] = fn
+            with open(fn, "rt") as f:
+                pending += list(imported_module_names(f.read()))
+    return files
+
+
+def source_digest(module_name: str) -> str:
+    h = hashlib.sha256()
+    for name, fn in sorted(source_files(module_name).items()):
+        h.update(name.encode())
+        h.update(file_digest(fn).encode())
+    return h.hexdigest()
+
+
+def digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class DiskCache:
+    """
+    Pickled values in a directory, one file per key. Once the files add up to
+    more than `max_size` bytes, the least recently used ones are evicted.
+    """
+
+    directory: str
+    max_size: int
+
+    def __init__(self, directory: str, max_size: int = 64 << 20) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Any:
+        try:
+            with open(self.path(key), "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError) as e:
+            raise KeyError(key) from e
+        try:
+            # Mark it as recently used
+            os.utime(self.path(key))
+        except FileNotFoundError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # Written aside and renamed, so that concurrent readers never see half a file
+        (fd, tmp) = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def entries(self) -> List[os.DirEntry[str]]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [e for e in it if e.is_file() and not e.name.startswith(".")]
+        except FileNotFoundError:
+            return []
+
+    def evict(self) -> None:
+        entries = sorted(
+            (e.stat().st_mtime, e.stat().st_size, e.path) for e in self.entries()
+        )
+        size = sum(entry_size for (_, entry_size, _) in entries)
+        for (_, entry_size, path) in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            os.unlink(entry.path)
+
+
+parsed_inputs: Optional[DiskCache] = None
+
+
+@contextlib.contextmanager
+def caching_parsed_inputs(cache: DiskCache) -> Generator[None, None, None]:
+    """
+    Functions decorated with `cached_parse` use the cache within the block.
+    """
+
+    global parsed_inputs
+    previous = parsed_inputs
+    parsed_inputs = cache
+    try:
+        yield
+    finally:
+        parsed_inputs = previous
+
+
+def cached_parse(parse: Callable[[str], T]) -> Callable[[str], T]:
+    """
+    Pickles what the decorated function parsed from the input file, so that a
+    repeated run loads it instead of parsing the text again. The entries are
+    keyed by the input and by the source of the parser's module.
+    """
+
+    @functools.wraps(parse)
+    def cached(fn: str) -> T:
+        if parsed_inputs is None or fn == "-":
+            return parse(fn)
+
+        key = digest(
+            parse.__module__,
+            parse.__qualname__,
+            source_digest(parse.__module__),
+            file_digest(fn),
+        )
+        try:
+            parsed: T = parsed_inputs.get(key)
+            return parsed
+        except KeyError:
+            parsed = parse(fn)
+            parsed_inputs.put(key, parsed)
+            return parsed
+
+    return cached
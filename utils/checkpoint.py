@@ -0,0 +1,97 @@
+"""
+Checkpoints of the long simulations, so that an interrupted run resumes from
+the last one instead of starting over.
+
+    simulation = checkpoint.Simulation(__name__, "part2", monkeys)
+    (start, monkeys) = simulation.resume(0, monkeys)
+    for round_no in range(start, rounds):
+        ...
+        if simulation.due():
+            simulation.save(round_no + 1, monkeys)
+    simulation.finish()
+
+It all does nothing unless a `checkpointing()` block is active.
+"""
+
+import contextlib
+import hashlib
+import pickle
+import time
+from typing import Any, Generator, Optional, Tuple, TypeVar
+
+from utils.cache import DiskCache, digest, source_digest
+
+T = TypeVar("T")
+
+store: Optional[DiskCache] = None
+# Seconds between checkpoints
+interval = 60.0
+
+
+@contextlib.contextmanager
+def checkpointing(cache: DiskCache, every: float = 60.0) -> Generator[None, None, None]:
+    """
+    Within the block simulations resume from their checkpoints in the cache,
+    and save new ones every `every` seconds.
+    """
+
+    global store, interval
+    previous = (store, interval)
+    (store, interval) = (cache, every)
+    try:
+        yield
+    finally:
+        (store, interval) = previous
+
+
+class Simulation:
+    """
+    One run of a simulation, identified by the module running it, a name, and
+    its initial state. The checkpoints of a module whose source changed are
+    not resumed from.
+    """
+
+    key: Optional[str]
+    _next_save: float
+
+    def __init__(self, module: str, name: str, initial: Any) -> None:
+        # Hashed right away, as the state is usually modified as it runs
+        self.key = (
+            None
+            if store is None
+            else digest(
+                module,
+                name,
+                source_digest(module),
+                hashlib.sha256(
+                    pickle.dumps(initial, protocol=pickle.HIGHEST_PROTOCOL)
+                ).hexdigest(),
+            )
+        )
+        self._next_save = time.monotonic() + interval
+
+    def resume(self, step: int, state: T) -> Tuple[int, T]:
+        """
+        The step and state of the last checkpoint, the given ones if there is
+        none.
+        """
+
+        if store is None or self.key is None:
+            return (step, state)
+        try:
+            resumed: Tuple[int, T] = store.get(self.key)
+            return resumed
+        except KeyError:
+            return (step, state)
+
+    def due(self) -> bool:
+        return self.key is not None and time.monotonic() >= self._next_save
+
+    def save(self, step: int, state: Any) -> None:
+        if store is not None and self.key is not None:
+            store.put(self.key, (step, state))
+        self._next_save = time.monotonic() + interval
+
+    def finish(self) -> None:
+        if store is not None and self.key is not None:
+            store.delete(self.key)
@@ -1,11 +1,36 @@
-from dataclasses import dataclass
-from typing import Dict, List, Set
+import io
+from bisect import bisect_left, bisect_right
+from typing import (
+    IO,
+    Dict,
+    Final,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSet,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 
-@dataclass(frozen=True)
 class Point:
-    x: int
-    y: int
+    """
+    An immutable point. Hashed once on creation, as the simulations look
+    points up in sets far more often than they create them.
+    """
+
+    __slots__ = ("x", "y", "_hash")
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x: Final = x
+        self.y: Final = y
+        self._hash: Final = hash((x, y))
 
     @staticmethod
     def from_string(string: str) -> "Point":
@@ -18,6 +43,275 @@ class Point:
     def distance(self, other: "Point") -> int:
         return abs(self.x - other.x) + abs(self.y - other.y)
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self._hash == other._hash and self.x == other.x and self.y == other.y
+
+    def __repr__(self) -> str:
+        return f"Point(x={self.x}, y={self.y})"
+
+
+# y gets the low 32 bits of a packed point
+Y_BITS = 32
+Y_OFFSET = 1 << (Y_BITS - 1)
+
+
+def pack(x: int, y: int) -> int:
+    return (x << Y_BITS) + y + Y_OFFSET
+
+
+def unpack(packed: int) -> Point:
+    (x, y) = divmod(packed, 1 << Y_BITS)
+    return Point(x, y - Y_OFFSET)
+
+
+class PointSet(MutableSet[Point]):
+    """
+    A set of points kept as packed ints, with `has(x, y)` and `add_xy(x, y)`
+    for the loops that would otherwise create a Point only to look it up.
+    |y| must be below 2^31.
+    """
+
+    __slots__ = ("_packed",)
+
+    _packed: Set[int]
+
+    def __init__(self, points: Iterable[Point] = ()) -> None:
+        self._packed = {pack(p.x, p.y) for p in points}
+
+    def has(self, x: int, y: int) -> bool:
+        return pack(x, y) in self._packed
+
+    def add_xy(self, x: int, y: int) -> None:
+        self._packed.add(pack(x, y))
+
+    def __contains__(self, point: object) -> bool:
+        return isinstance(point, Point) and pack(point.x, point.y) in self._packed
+
+    def __iter__(self) -> Iterator[Point]:
+        return (unpack(packed) for packed in self._packed)
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def add(self, point: Point) -> None:
+        self._packed.add(pack(point.x, point.y))
+
+    def discard(self, point: Point) -> None:
+        self._packed.discard(pack(point.x, point.y))
+
+
+class IntervalSet:
+    """
+    A set of integers kept as sorted, disjoint, closed intervals. Adding an
+    interval merges it with the ones it overlaps or touches, so (1, 3) and
+    (4, 5) end up as (1, 5).
+    """
+
+    __slots__ = ("_lows", "_highs", "_covered")
+
+    _lows: List[int]
+    _highs: List[int]
+    _covered: int
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()) -> None:
+        self._lows = []
+        self._highs = []
+        self._covered = 0
+        for (low, high) in intervals:
+            self.add(low, high)
+
+    def add(self, low: int, high: int) -> None:
+        assert low <= high, (low, high)
+        # The intervals from i to j touch the new one
+        i = bisect_left(self._highs, low - 1)
+        j = bisect_right(self._lows, high + 1)
+        if i < j:
+            low = min(low, self._lows[i])
+            high = max(high, self._highs[j - 1])
+            for k in range(i, j):
+                self._covered -= self._highs[k] - self._lows[k] + 1
+        self._lows[i:j] = [low]
+        self._highs[i:j] = [high]
+        self._covered += high - low + 1
+
+    def covered(self) -> int:
+        """
+        The number of integers in the set.
+        """
+
+        return self._covered
+
+    def overlaps(self, low: int, high: int) -> bool:
+        i = bisect_left(self._highs, low)
+        return i < len(self._lows) and self._lows[i] <= high
+
+    def contains(self, low: int, high: int) -> bool:
+        i = bisect_right(self._lows, low) - 1
+        return i >= 0 and self._highs[i] >= high
+
+    def __contains__(self, x: object) -> bool:
+        return isinstance(x, int) and self.contains(x, x)
+
+    def gaps(self, low: int, high: int) -> Generator[Tuple[int, int], None, None]:
+        """
+        The intervals between `low` and `high` not in the set, in order.
+        """
+
+        i = bisect_left(self._highs, low)
+        while i < len(self._lows) and self._lows[i] <= high:
+            if self._lows[i] > low:
+                yield (low, self._lows[i] - 1)
+            low = self._highs[i] + 1
+            i += 1
+        if low <= high:
+            yield (low, high)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._lows, self._highs)
+
+    def __len__(self) -> int:
+        """
+        The number of intervals.
+        """
+
+        return len(self._lows)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+
+Coords = Tuple[int, ...]
+
+V = TypeVar("V")
+
+
+def manhattan(a: Coords, b: Coords) -> int:
+    return sum(abs(p - q) for (p, q) in zip(a, b))
+
+
+class KDTree(Generic[V]):
+    """
+    A static k-d tree of values at integer coordinates of any one dimension,
+    for box, Manhattan radius and nearest neighbor queries that skip the
+    parts of space that can not hold an answer.
+
+    The tree is implicit: each slice of the arrays is a subtree, with its root
+    at the middle and split on the axis of its depth.
+    """
+
+    dimensions: int
+    _coords: List[Coords]
+    _values: List[V]
+
+    def __init__(self, entries: Iterable[Tuple[Sequence[int], V]]) -> None:
+        items = [(tuple(coords), value) for (coords, value) in entries]
+        self.dimensions = len(items[0][0]) if items else 0
+        assert all(len(coords) == self.dimensions for (coords, _) in items)
+
+        stack = [(0, len(items), 0)]
+        while stack:
+            (low, high, axis) = stack.pop()
+            if high - low <= 1:
+                continue
+            items[low:high] = sorted(items[low:high], key=lambda e: e[0][axis])
+            middle = (low + high) // 2
+            next_axis = (axis + 1) % self.dimensions
+            stack.append((low, middle, next_axis))
+            stack.append((middle + 1, high, next_axis))
+
+        self._coords = [coords for (coords, _) in items]
+        self._values = [value for (_, value) in items]
+
+    @staticmethod
+    def of_points(points: Iterable[Point]) -> "KDTree[Point]":
+        return KDTree(((p.x, p.y), p) for p in points)
+
+    @staticmethod
+    def of_coords(coords: Iterable[Coords]) -> "KDTree[Coords]":
+        return KDTree((c, c) for c in coords)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def box(self, low: Coords, high: Coords) -> List[V]:
+        """
+        The values with `low <= coords <= high` on every axis.
+        """
+
+        found = []
+        stack = [(0, len(self._coords), 0)]
+        while stack:
+            (start, end, axis) = stack.pop()
+            if start >= end:
+                continue
+            middle = (start + end) // 2
+            coords = self._coords[middle]
+            if all(l <= c <= h for (l, c, h) in zip(low, coords, high)):
+                found.append(self._values[middle])
+            next_axis = (axis + 1) % self.dimensions
+            if low[axis] <= coords[axis]:
+                stack.append((start, middle, next_axis))
+            if coords[axis] <= high[axis]:
+                stack.append((middle + 1, end, next_axis))
+        return found
+
+    def within(self, center: Coords, radius: int) -> List[V]:
+        """
+        The values at most `radius` away from `center` in Manhattan distance.
+        """
+
+        found = []
+        stack = [(0, len(self._coords), 0)]
+        while stack:
+            (start, end, axis) = stack.pop()
+            if start >= end:
+                continue
+            middle = (start + end) // 2
+            coords = self._coords[middle]
+            if manhattan(coords, center) <= radius:
+                found.append(self._values[middle])
+            next_axis = (axis + 1) % self.dimensions
+            if center[axis] - radius <= coords[axis]:
+                stack.append((start, middle, next_axis))
+            if coords[axis] <= center[axis] + radius:
+                stack.append((middle + 1, end, next_axis))
+        return found
+
+    def nearest(self, center: Coords) -> Optional[Tuple[int, V]]:
+        """
+        The Manhattan distance to the value closest to `center` and the value,
+        None if the tree is empty.
+        """
+
+        best: Optional[Tuple[int, int]] = None
+        # With the least distance along the splitting axes on the way, which
+        # no point of the subtree can beat
+        stack = [(0, len(self._coords), 0, 0)]
+        while stack:
+            (start, end, axis, bound) = stack.pop()
+            if start >= end or (best is not None and bound > best[0]):
+                continue
+            middle = (start + end) // 2
+            coords = self._coords[middle]
+            distance = manhattan(coords, center)
+            if best is None or distance < best[0]:
+                best = (distance, middle)
+            next_axis = (axis + 1) % self.dimensions
+            offset = center[axis] - coords[axis]
+            near = (start, middle) if offset < 0 else (middle + 1, end)
+            far = (middle + 1, end) if offset < 0 else (start, middle)
+            # The near side is popped first
+            stack.append((*far, next_axis, max(bound, abs(offset))))
+            stack.append((*near, next_axis, bound))
+        if best is None:
+            return None
+        return (best[0], self._values[best[1]])
+
 
 class HorizontalOrVerticalLine:
     low: Point
@@ -47,6 +341,14 @@ class HorizontalOrVerticalLine:
                 False
             ), f"Given coordinates are neither horizontal, nor vertical: {self}"
 
+    @property
+    def horizontal(self) -> bool:
+        """
+        Whether x is the same all along, i.e. the line is one row of a drawing.
+        """
+
+        return self.__horizontal
+
     def online(self, p: Point) -> bool:
         if self.__horizontal:
             return p.x == self.low.x and self.low.y <= p.y <= self.high.y
@@ -60,24 +362,50 @@ class HorizontalOrVerticalLine:
             return {Point(x, self.low.y) for x in range(self.low.x, self.high.x + 1)}
 
 
-def draw_coordinates(
-    points: Dict[Point, str], lines: List[HorizontalOrVerticalLine] = []
-) -> str:
+def write_coordinates(
+    out: IO[str],
+    points: Mapping[Point, str],
+    lines: Sequence[HorizontalOrVerticalLine] = (),
+) -> None:
+    """
+    Draws the points over the lines, a row for each x from the largest down,
+    writing out each row as soon as it is done so that large pictures need
+    not fit in memory as a whole.
+    """
+
     min_x = min([p.x for p in points.keys()] + [l.low.x for l in lines])
     max_x = max([p.x for p in points.keys()] + [l.high.x for l in lines])
     min_y = min([p.y for p in points.keys()] + [l.low.y for l in lines])
     max_y = max([p.y for p in points.keys()] + [l.high.y for l in lines])
+    width = max_y - min_y + 1
 
-    out = ""
+    points_by_row: Dict[int, List[Tuple[int, str]]] = {}
+    for (p, c) in points.items():
+        points_by_row.setdefault(p.x, []).append((p.y - min_y, c))
+    rows: Dict[int, List[HorizontalOrVerticalLine]] = {}
+    columns: List[HorizontalOrVerticalLine] = []
+    for l in lines:
+        if l.horizontal:
+            rows.setdefault(l.low.x, []).append(l)
+        else:
+            columns.append(l)
 
     for x in range(max_x, min_x - 1, -1):
-        for y in range(min_y, max_y + 1):
-            point = points.get(Point(x, y), None)
-            out += (
-                point
-                if point is not None
-                else ("#" if any(l.online(Point(x, y)) for l in lines) else ".")
-            )
-        out += "\n"
-
-    return out
+        row = ["."] * width
+        for l in rows.get(x, []):
+            row[l.low.y - min_y : l.high.y - min_y + 1] = "#" * (l.high.y - l.low.y + 1)
+        for l in columns:
+            if l.low.x <= x <= l.high.x:
+                row[l.low.y - min_y] = "#"
+        for (y, c) in points_by_row.get(x, []):
+            row[y] = c
+        out.write("".join(row))
+        out.write("\n")
+
+
+def draw_coordinates(
+    points: Mapping[Point, str], lines: Sequence[HorizontalOrVerticalLine] = ()
+) -> str:
+    out = io.StringIO()
+    write_coordinates(out, points, lines)
+    return out.getvalue()
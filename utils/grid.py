@@ -0,0 +1,209 @@
+"""
+NumPy grids, apart from `utils.matrix` so that only the days using them pay
+for importing NumPy.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+T = TypeVar("T")
+
+
+class Grid:
+    """
+    A grid of any number of dimensions in a NumPy array, for the neighbor
+    operations to run on every cell at once instead of cell by cell. The
+    neighbors of a cell are the ones a step away along a single axis.
+    """
+
+    cells: npt.NDArray[Any]
+
+    def __init__(self, cells: npt.ArrayLike) -> None:
+        self.cells = np.asarray(cells)
+
+    @staticmethod
+    def from_matrix(matrix: List[List[T]]) -> "Grid":
+        return Grid(np.array(matrix))
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.cells.shape
+
+    def directions(self) -> Generator[Tuple[int, int], None, None]:
+        """
+        (axis, step) to each of the neighbors.
+        """
+
+        for axis in range(self.cells.ndim):
+            yield (axis, -1)
+            yield (axis, 1)
+
+    def __slices(self, axis: int, start: int, stop: Optional[int]) -> Any:
+        index = [slice(None)] * self.cells.ndim
+        index[axis] = slice(start, stop)
+        return tuple(index)
+
+    def neighbor(self, axis: int, step: int, fill: Any) -> "Grid":
+        """
+        Each cell holds the value of the cell `step` cells away from it along
+        `axis`, or `fill` where that is outside the grid.
+        """
+
+        result = np.full_like(self.cells, fill)
+        length = self.shape[axis]
+        step = max(-length, min(step, length))
+        if step >= 0:
+            result[self.__slices(axis, 0, length - step)] = self.cells[
+                self.__slices(axis, step, None)
+            ]
+        else:
+            result[self.__slices(axis, -step, None)] = self.cells[
+                self.__slices(axis, 0, length + step)
+            ]
+        return Grid(result)
+
+    def inside(self, axis: int, step: int) -> "Grid":
+        """
+        Whether the cell `step` cells away along `axis` is in the grid.
+        """
+
+        return Grid(np.ones(self.shape, dtype=bool)).neighbor(axis, step, False)
+
+    def running_max(self, axis: int, reverse: bool = False) -> "Grid":
+        """
+        The largest value up to and including each cell along `axis`, counting
+        from the end if `reverse`.
+        """
+
+        cells = np.flip(self.cells, axis) if reverse else self.cells
+        result = np.maximum.accumulate(cells, axis=axis)
+        return Grid(np.flip(result, axis) if reverse else result)
+
+    def running_min(self, axis: int, reverse: bool = False) -> "Grid":
+        cells = np.flip(self.cells, axis) if reverse else self.cells
+        result = np.minimum.accumulate(cells, axis=axis)
+        return Grid(np.flip(result, axis) if reverse else result)
+
+    def local_minima(self) -> "Grid":
+        """
+        Whether each cell is lower than all of its neighbors.
+        """
+
+        lower = np.ones(self.shape, dtype=bool)
+        for (axis, step) in self.directions():
+            neighbor = self.neighbor(axis, step, 0).cells
+            lower &= ~self.inside(axis, step).cells | (self.cells < neighbor)
+        return Grid(lower)
+
+    def local_maxima(self) -> "Grid":
+        higher = np.ones(self.shape, dtype=bool)
+        for (axis, step) in self.directions():
+            neighbor = self.neighbor(axis, step, 0).cells
+            higher &= ~self.inside(axis, step).cells | (self.cells > neighbor)
+        return Grid(higher)
+
+    def spread(self, reached: "Grid") -> "Grid":
+        """
+        One step of a flood: the reached cells and their neighbors, as far as
+        the cells of this grid let it through.
+        """
+
+        result = reached.cells.copy()
+        for (axis, step) in self.directions():
+            result |= reached.neighbor(axis, step, False).cells
+        return Grid(result & self.cells.astype(bool))
+
+    def flood(self, *start: int) -> "Grid":
+        """
+        The cells reachable from `start` through the truthy cells.
+        """
+
+        reached = np.zeros(self.shape, dtype=bool)
+        reached[start] = bool(self.cells[start])
+        flooded = Grid(reached)
+        while True:
+            spread = self.spread(flooded)
+            if np.array_equal(spread.cells, flooded.cells):
+                return flooded
+            flooded = spread
+
+    def faces(self, other: "Grid", outside: bool = False) -> int:
+        """
+        The number of pairs of neighboring cells truthy in this grid and in
+        `other` respectively, counting the cells just outside the grid as
+        `outside` in `other`.
+        """
+
+        mask = self.cells.astype(bool)
+        other_mask = other.cells.astype(bool)
+        return sum(
+            int(
+                np.count_nonzero(
+                    mask & Grid(other_mask).neighbor(axis, step, outside).cells
+                )
+            )
+            for (axis, step) in self.directions()
+        )
+
+
+@dataclass(frozen=True)
+class Adjacency:
+    """
+    The edges of a grid graph in compressed sparse rows: the cells are
+    numbered row by row, and the neighbors of cell `c` are
+    `targets[offsets[c]:offsets[c + 1]]`.
+    """
+
+    rows: int
+    cols: int
+    offsets: List[int]
+    targets: List[int]
+
+    def cell(self, x: int, y: int) -> int:
+        return x * self.cols + y
+
+    def coords(self, cell: int) -> Tuple[int, int]:
+        (x, y) = divmod(cell, self.cols)
+        return (x, y)
+
+    def neighbors(self, cell: int) -> List[int]:
+        return self.targets[self.offsets[cell] : self.offsets[cell + 1]]
+
+
+STEPS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+DIAGONAL_STEPS = [(-1, -1), (1, 1), (1, -1), (-1, 1)]
+
+
+def adjacency(
+    grid: Grid,
+    edge: Callable[[npt.NDArray[Any], npt.NDArray[Any]], npt.NDArray[np.bool_]],
+    diagonal: bool = False,
+) -> Adjacency:
+    """
+    Compiles the edges of a 2D grid once, for the searches to only walk lists
+    of cell numbers afterwards. `edge(here, there)` gets the values of the
+    cells and of their neighbors in one direction as arrays, and tells which
+    of them are connected.
+    """
+
+    (rows, cols) = grid.shape
+    cells = np.arange(rows * cols).reshape(rows, cols)
+    steps = STEPS + DIAGONAL_STEPS if diagonal else STEPS
+    allowed = []
+    targets = []
+    for (dx, dy) in steps:
+        there = grid.neighbor(0, dx, 0).neighbor(1, dy, 0).cells
+        inside = grid.inside(0, dx).cells & grid.inside(1, dy).cells
+        allowed.append(inside & edge(grid.cells, there))
+        targets.append(cells + dx * cols + dy)
+
+    # One row per cell, one column per direction
+    allowed_by_cell = np.stack(allowed, axis=-1).reshape(rows * cols, len(steps))
+    targets_by_cell = np.stack(targets, axis=-1).reshape(rows * cols, len(steps))
+    offsets = np.concatenate(([0], np.cumsum(allowed_by_cell.sum(axis=1))))
+    return Adjacency(
+        rows, cols, offsets.tolist(), targets_by_cell[allowed_by_cell].tolist()
+    )
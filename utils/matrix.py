@@ -1,4 +1,15 @@
-from typing import Any, Callable, Generator, Iterator, List, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
@@ -106,22 +117,73 @@ def rows(matrix: List[List[T]]) -> Generator[List[T], None, None]:
         yield row
 
 
-def cols(matrix: List[List[T]]) -> Generator[List[T], None, None]:
-    for col in range(len(matrix[0])):
-        yield [row[col] for row in matrix]
-
-
-def left_of(matrix: List[List[T]], row: int, col: int) -> List[T]:
-    return list(reversed(matrix[row][:col]))
-
-
-def right_of(matrix: List[List[T]], row: int, col: int) -> List[T]:
-    return matrix[row][col + 1 :]
-
-
-def up_of(matrix: List[List[T]], row: int, col: int) -> List[T]:
-    return list(reversed([rw[col] for rw in matrix[:row]]))
-
-
-def down_of(matrix: List[List[T]], row: int, col: int) -> List[T]:
-    return [rw[col] for rw in matrix[row + 1 :]]
+class FlatGrid:
+    """
+    A grid of bytes in a single bytearray, row after row, optionally inside a
+    `border` of `fill` cells so that a step off the grid lands on `fill`
+    instead of wrapping to the next row. Coordinates count the border, so the
+    first cell given is at (border, border).
+
+    Rows, columns and the lines of sight from a cell are memoryviews or
+    iterators over the bytearray, none of them copies it.
+    """
+
+    width: int
+    height: int
+    cells: bytearray
+    # Flat index offsets to the neighbors: up, down, left, right
+    offsets: Tuple[int, int, int, int]
+
+    def __init__(
+        self, rows: Sequence[Sequence[int]], fill: int = 0, border: int = 0
+    ) -> None:
+        self.width = max((len(row) for row in rows), default=0) + 2 * border
+        self.height = len(rows) + 2 * border
+        self.cells = bytearray([fill]) * (self.width * self.height)
+        for (x, row) in enumerate(rows, border):
+            start = x * self.width + border
+            self.cells[start : start + len(row)] = bytes(row)
+        self.offsets = (-self.width, self.width, -1, 1)
+
+    @staticmethod
+    def from_lines(
+        lines: Iterable[str], fill: str = " ", border: int = 0
+    ) -> "FlatGrid":
+        """
+        Rows shorter than the longest are padded with `fill`.
+        """
+
+        return FlatGrid([line.encode() for line in lines], ord(fill), border)
+
+    def index(self, x: int, y: int) -> int:
+        return x * self.width + y
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        (x, y) = divmod(index, self.width)
+        return (x, y)
+
+    def __getitem__(self, coords: Tuple[int, int]) -> int:
+        (x, y) = coords
+        return self.cells[x * self.width + y]
+
+    def row(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x * self.width : (x + 1) * self.width]
+
+    def col(self, y: int) -> memoryview:
+        return memoryview(self.cells)[y :: self.width]
+
+    def left_of(self, x: int, y: int) -> Iterator[int]:
+        """
+        The cells of the row from the one left of (x, y) to the first.
+        """
+
+        return reversed(self.row(x)[:y])
+
+    def right_of(self, x: int, y: int) -> memoryview:
+        return self.row(x)[y + 1 :]
+
+    def up_of(self, x: int, y: int) -> Iterator[int]:
+        return reversed(self.col(y)[:x])
+
+    def down_of(self, x: int, y: int) -> memoryview:
+        return self.col(y)[x + 1 :]
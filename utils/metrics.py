@@ -0,0 +1,98 @@
+"""
+Counters and histograms for the hot paths of the solvers, to see what a search or
+simulation is doing without a profiler.
+
+    from utils import metrics
+
+    metrics.count("day16.visit")
+    metrics.observe("day17.column_height", len(column))
+
+Both return immediately unless a `collecting()` block is active. That is
+still a call, so in the hottest loops guard them with `if metrics.enabled:`.
+"""
+
+import contextlib
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Generator
+
+enabled = False
+
+
+@dataclass
+class Histogram:
+    count: int = 0
+    total: float = 0
+    min: float = math.inf
+    max: float = -math.inf
+    # Upper bounds (powers of 2) and the number of values up to them
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        bucket = 0 if value <= 0 else 1 << math.ceil(math.log2(value))
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def __str__(self) -> str:
+        string = (
+            f"count={self.count} mean={self.mean():.2f} "
+            f"min={self.min:g} max={self.max:g}"
+        )
+        width = max(self.buckets.values(), default=0)
+        for bucket, count in sorted(self.buckets.items()):
+            bar = "#" * math.ceil(40 * count / width)
+            string += f"\n    <= {bucket:<10} {count:>10} {bar}"
+        return string
+
+
+@dataclass
+class Metrics:
+    counters: Dict[str, int] = field(default_factory=dict)
+    histograms: Dict[str, Histogram] = field(default_factory=dict)
+
+    def report(self) -> str:
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name}: {value}")
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"  {name}: {histogram}")
+        return "\n".join(lines)
+
+
+current = Metrics()
+
+
+def count(name: str, n: int = 1) -> None:
+    if enabled:
+        current.counters[name] = current.counters.get(name, 0) + n
+
+
+def observe(name: str, value: float) -> None:
+    if enabled:
+        try:
+            current.histograms[name].add(value)
+        except KeyError:
+            current.histograms[name] = Histogram()
+            current.histograms[name].add(value)
+
+
+@contextlib.contextmanager
+def collecting() -> Generator[Metrics, None, None]:
+    """
+    Collects into fresh metrics for the duration of the block.
+    """
+
+    global current, enabled
+    (previous, was_enabled) = (current, enabled)
+    current = Metrics()
+    enabled = True
+    try:
+        yield current
+    finally:
+        (current, enabled) = (previous, was_enabled)
@@ -0,0 +1,88 @@
+"""
+Progress of the long searches, to see how far they got while they run.
+
+    from utils import progress
+
+    progress.node(depth, released)
+
+counts a node of the search at the given depth, and the value of the best
+solution it found so far. It returns immediately unless a `reporting()` block
+is active, which hands the progress to a callback every `interval` seconds.
+Searches expanding many nodes guard it with `if progress.enabled:`, which
+costs less than the call.
+"""
+
+import contextlib
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Generator, Optional
+
+# Only look at the clock every this many nodes
+CLOCK_EVERY = 1 << 12
+
+
+@dataclass
+class Progress:
+    nodes: int = 0
+    best: Optional[float] = None
+    depth: int = 0
+    max_depth: int = 0
+    seconds: float = 0
+
+    def __str__(self) -> str:
+        best = "-" if self.best is None else f"{self.best:g}"
+        return (
+            f"nodes={self.nodes} best={best} depth={self.depth} "
+            f"max_depth={self.max_depth} after {self.seconds:.1f}s"
+        )
+
+
+enabled = False
+current = Progress()
+interval = 1.0
+report: Callable[[Progress], None] = lambda progress: None
+start = 0.0
+next_report = 0.0
+
+
+def node(depth: int, value: Optional[float] = None) -> None:
+    if enabled:
+        current.nodes += 1
+        current.depth = depth
+        current.max_depth = max(current.max_depth, depth)
+        if value is not None and (current.best is None or value > current.best):
+            current.best = value
+        if current.nodes % CLOCK_EVERY == 0:
+            tick()
+
+
+def tick() -> None:
+    global next_report
+    now = time.perf_counter()
+    if now >= next_report:
+        current.seconds = now - start
+        report(replace(current))
+        next_report = now + interval
+
+
+@contextlib.contextmanager
+def reporting(
+    callback: Callable[[Progress], None], every: float = 1.0
+) -> Generator[Progress, None, None]:
+    """
+    Tracks fresh progress for the duration of the block, handing a copy of it
+    to the callback at most every `every` seconds.
+    """
+
+    global current, enabled, interval, report, start, next_report
+    previous = (current, enabled, interval, report, start, next_report)
+    current = Progress()
+    enabled = True
+    (interval, report) = (every, callback)
+    start = time.perf_counter()
+    next_report = start + every
+    try:
+        yield current
+    finally:
+        current.seconds = time.perf_counter() - start
+        (current, enabled, interval, report, start, next_report) = previous
@@ -0,0 +1,163 @@
+"""
+Shortest paths over any graph given as a function from a node to its
+neighbors, e.g. `Adjacency.neighbors` of a grid compiled by
+`utils.grid.adjacency`.
+
+    from utils import search
+
+    found = search.bfs([start], graph.neighbors, target=lambda cell: cell == end)
+    found.distances[end]
+
+They all start from every node of `starts` at once, stop as soon as they take
+a node satisfying `target` off the frontier, and expand each node at most
+once. Nodes count towards `utils.progress` as they are expanded.
+"""
+
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from utils import progress
+
+N = TypeVar("N", bound=Hashable)
+
+
+@dataclass
+class Search(Generic[N]):
+    # Of the nodes expanded, and for a BFS, of the ones seen as well
+    distances: Dict[N, int] = field(default_factory=dict)
+    # The node each one was reached from, none for the starts
+    previous: Dict[N, N] = field(default_factory=dict)
+    # The target reached, if any
+    found: Optional[N] = None
+
+    def path(self, node: N) -> List[N]:
+        """
+        The nodes from one of the starts to `node`, both included.
+        """
+
+        path = [node]
+        while path[-1] in self.previous:
+            path.append(self.previous[path[-1]])
+        path.reverse()
+        return path
+
+
+def bfs(
+    starts: Iterable[N],
+    neighbors: Callable[[N], Iterable[N]],
+    target: Optional[Callable[[N], bool]] = None,
+) -> Search[N]:
+    """
+    For unit steps. The first time a node is seen is by one of its shortest
+    paths, so its distance is final right away.
+    """
+
+    found: Search[N] = Search()
+    (distances, previous) = (found.distances, found.previous)
+    frontier: Deque[N] = deque()
+    for start in starts:
+        if start not in distances:
+            distances[start] = 0
+            frontier.append(start)
+
+    while frontier:
+        node = frontier.popleft()
+        distance = distances[node]
+        if progress.enabled:
+            progress.node(distance)
+        if target is not None and target(node):
+            found.found = node
+            return found
+        for neighbor in neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = distance + 1
+                previous[neighbor] = node
+                frontier.append(neighbor)
+    return found
+
+
+def astar(
+    starts: Iterable[N],
+    neighbors: Callable[[N], Iterable[Tuple[N, int]]],
+    heuristic: Callable[[N], int],
+    target: Optional[Callable[[N], bool]] = None,
+) -> Search[N]:
+    """
+    `neighbors` gives the cost of the step to each neighbor, which must not be
+    negative. `heuristic` must not overestimate the cost to the nearest
+    target, and for the nodes to be expanded once, must not drop by more than
+    the cost of a step.
+    """
+
+    found: Search[N] = Search()
+    (distances, previous) = (found.distances, found.previous)
+    # Best known so far, for the nodes not expanded yet
+    tentative: Dict[N, int] = {}
+    # The counter breaks ties without comparing nodes
+    order = itertools.count()
+    frontier: List[Tuple[int, int, N]] = []
+    for start in starts:
+        if start not in tentative:
+            tentative[start] = 0
+            heapq.heappush(frontier, (heuristic(start), next(order), start))
+
+    while frontier:
+        (_, _, node) = heapq.heappop(frontier)
+        if node in distances:
+            # Pushed again with a shorter distance, and expanded then
+            continue
+        distance = distances[node] = tentative.pop(node)
+        if progress.enabled:
+            progress.node(distance)
+        if target is not None and target(node):
+            found.found = node
+            return found
+        for (neighbor, cost) in neighbors(node):
+            if neighbor in distances:
+                continue
+            through = distance + cost
+            if neighbor not in tentative or through < tentative[neighbor]:
+                tentative[neighbor] = through
+                previous[neighbor] = node
+                priority = through + heuristic(neighbor)
+                heapq.heappush(frontier, (priority, next(order), neighbor))
+    return found
+
+
+def no_heuristic(node: Hashable) -> int:
+    return 0
+
+
+def dijkstra(
+    starts: Iterable[N],
+    neighbors: Callable[[N], Iterable[Tuple[N, int]]],
+    target: Optional[Callable[[N], bool]] = None,
+) -> Search[N]:
+    return astar(starts, neighbors, no_heuristic, target)
+
+
+def manhattan(goal: Tuple[int, int]) -> Callable[[Tuple[int, int]], int]:
+    """
+    The heuristic for unit steps on a grid without diagonals.
+    """
+
+    (goal_x, goal_y) = goal
+
+    def distance(node: Tuple[int, int]) -> int:
+        return abs(node[0] - goal_x) + abs(node[1] - goal_y)
+
+    return distance
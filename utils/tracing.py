@@ -0,0 +1,100 @@
+"""
+Nested wall-clock spans of the phases of a part (parsing, precomputing,
+searching), exported as Chrome trace events to be opened in Perfetto or
+chrome://tracing.
+
+    from utils import tracing
+
+    with tracing.span("distances"):
+        ...
+
+    @tracing.traced
+    def parse_cave(fn: str) -> Cave:
+        ...
+
+Both return right away unless a `recording()` block is active. They are meant
+for phases, not for the calls of a hot loop.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Dict, Generator, List, TypeVar
+
+T = TypeVar("T")
+
+enabled = False
+
+
+@dataclass
+class Trace:
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def dump(self, out: IO[str]) -> None:
+        json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, out)
+
+
+current = Trace()
+
+
+@contextlib.contextmanager
+def span(name: str, **args: Any) -> Generator[None, None, None]:
+    if not enabled:
+        yield
+        return
+
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end = time.perf_counter_ns()
+        # A complete event; the monotonic clock is shared by the processes of
+        # a pool, so their spans line up
+        current.events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+
+def traced(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Records a span named after the function for each call.
+    """
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        if not enabled:
+            return func(*args, **kwargs)
+        with span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def recording() -> Generator[Trace, None, None]:
+    """
+    Records into a fresh trace for the duration of the block.
+    """
+
+    global current, enabled
+    (previous, was_enabled) = (current, enabled)
+    current = Trace()
+    enabled = True
+    try:
+        yield current
+    finally:
+        (current, enabled) = (previous, was_enabled)